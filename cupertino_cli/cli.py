@@ -2,21 +2,33 @@
 Cupertino CLI - Main entry point.
 
 Provides command-line interface for sending MQTT commands to StreamProcessor.
+
+Startup cost matters here (one process per command), so `yaml` and
+`paho.mqtt` are imported lazily by the code paths that need them. Well-formed
+command lines are parsed by a small hand-rolled scanner; `argparse` is only
+imported for --help and usage errors. With CUPERTINO_CLI_DAEMON=1, commands
+go through a warm MQTT session held by the CLI daemon (see daemon.py).
 """
 
-import argparse
-import yaml
+import functools
+import os
 import sys
-from pathlib import Path
-from typing import Dict, Any
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
 
-from .mqtt_client import MQTTCommandClient
+# Configs larger than this (bytes) are parsed from a memory map
+MMAP_THRESHOLD = 16 * 1024
 
 
 def load_yaml_config(config_path: str) -> Dict[str, Any]:
     """
     Load YAML configuration file.
 
+    Small files are read normally; files above MMAP_THRESHOLD are parsed
+    from a read-only memory map, so the whole file is never copied into a
+    Python buffer before parsing.
+
     Args:
         config_path: Path to YAML file
 
@@ -27,19 +39,95 @@ def load_yaml_config(config_path: str) -> Dict[str, Any]:
         FileNotFoundError: If config file doesn't exist
         ValueError: If YAML is invalid
     """
-    path = Path(config_path)
+    import yaml
 
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    # LibYAML-backed loader when available (~10x faster), pure-Python fallback
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
     try:
-        with open(path) as f:
-            config = yaml.safe_load(f)
-        return config
+        # Binary mode: LibYAML decodes the raw bytes itself. No exists()
+        # pre-check: open() already fails fast (one syscall, not two)
+        with open(config_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                import mmap
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return yaml.load(mm, Loader=loader)
+
+            return yaml.load(f, Loader=loader)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}")
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {config_path}: {e}")
 
 
+def load_batch_config(config_path: str) -> List[Dict[str, Any]]:
+    """
+    Load a batch of commands from a YAML file.
+
+    The file holds a YAML list; each item is a command mapping in the same
+    format as the add-zone/set-model configs.
+
+    Args:
+        config_path: Path to YAML file
+
+    Returns:
+        List of command dictionaries
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+        ValueError: If YAML is invalid or not a list of commands
+    """
+    commands = load_yaml_config(config_path)
+
+    if not isinstance(commands, list) or not commands:
+        raise ValueError(f"Batch file {config_path} must be a non-empty list of commands")
+
+    for i, command in enumerate(commands):
+        if not isinstance(command, dict) or not command.get('command'):
+            raise ValueError(f"Batch file {config_path}: item {i} has no 'command' key")
+
+    return commands
+
+
+@functools.lru_cache(maxsize=None)
+def command_topic(service_id: str) -> str:
+    """
+    Control plane command topic for a service (built once per service_id).
+
+    Args:
+        service_id: Target service ID
+
+    Returns:
+        Topic string, e.g. "cupertino/control/cam_01/commands"
+    """
+    return f"cupertino/control/{service_id}/commands"
+
+
+def _send_via_daemon(
+    commands: List[Dict[str, Any]],
+    service_id: str,
+    broker: str,
+    port: int
+) -> bool:
+    """
+    Route commands through the CLI daemon when enabled (see daemon.py).
+
+    Returns:
+        True if the daemon sent the commands, False to publish directly
+    """
+    from . import daemon
+
+    if not daemon.enabled():
+        return False
+    if not daemon.send(commands, command_topic(service_id), broker, port):
+        return False
+
+    for command in commands:
+        print(f"✅ Command sent: {command.get('command', 'unknown')}")
+    return True
+
+
 def send_command(
     command: Dict[str, Any],
     service_id: str = "cam_01",
@@ -55,14 +143,179 @@ def send_command(
         broker: MQTT broker host
         port: MQTT broker port
     """
-    topic = f"cupertino/control/{service_id}/commands"
+    if _send_via_daemon([command], service_id, broker, port):
+        return
 
-    client = MQTTCommandClient(broker=broker, port=port)
-    client.send_command(topic, command, qos=1)
+    from .mqtt_client import MQTTCommandClient
 
+    topic = command_topic(service_id)
+
+    with MQTTCommandClient(broker=broker, port=port) as client:
+        client.send_command(topic, command, qos=1)
+
+
+def send_simple_command(
+    name: str,
+    service_id: str = "cam_01",
+    broker: str = "localhost",
+    port: int = 1883
+) -> None:
+    """
+    Send an argument-free command (pause, resume, status, ...).
+
+    Uses the pre-serialized payload instead of building and encoding a dict.
+
+    Args:
+        name: Command name (key of SIMPLE_COMMAND_PAYLOADS)
+        service_id: Target service ID
+        broker: MQTT broker host
+        port: MQTT broker port
+    """
+    if _send_via_daemon([{'command': name}], service_id, broker, port):
+        return
+
+    from .mqtt_client import MQTTCommandClient, SIMPLE_COMMAND_PAYLOADS
+
+    topic = command_topic(service_id)
+
+    with MQTTCommandClient(broker=broker, port=port) as client:
+        client.send_raw(topic, SIMPLE_COMMAND_PAYLOADS[name], qos=1)
+
+    print(f"✅ Command sent: {name}")
+
+
+def send_batch(
+    commands: List[Dict[str, Any]],
+    service_id: str = "cam_01",
+    broker: str = "localhost",
+    port: int = 1883
+) -> None:
+    """
+    Send several commands over one MQTT session.
+
+    Publishes are pipelined and PUBACKs collected at the end, so the
+    batch costs roughly one round-trip instead of one per command.
+
+    Args:
+        commands: Command dictionaries
+        service_id: Target service ID
+        broker: MQTT broker host
+        port: MQTT broker port
+    """
+    if _send_via_daemon(commands, service_id, broker, port):
+        return
+
+    from .mqtt_client import MQTTCommandClient
+
+    topic = command_topic(service_id)
+
+    with MQTTCommandClient(broker=broker, port=port) as client:
+        client.send_command_batch(topic, commands, qos=1)
+
+
+# ============================================================
+# Command dispatch tables (subcommand -> payload)
+# ============================================================
+
+# Argument-free commands (payloads pre-serialized in mqtt_client)
+_SIMPLE_COMMANDS = frozenset({'pause', 'resume', 'status', 'health', 'list-zones'})
+
+# Commands whose payload is a YAML config file, sent as-is
+_YAML_COMMANDS = frozenset({'add-zone', 'set-model'})
+
+# Commands targeting a zone by ID: subcommand -> control plane command
+_ZONE_COMMANDS = {
+    'remove-zone': 'remove_zone',
+    'enable-zone': 'enable_zone',
+    'disable-zone': 'disable_zone',
+}
+
+# Payload builders for every non-simple command
+_BUILDERS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    **{name: (lambda args: load_yaml_config(args.config)) for name in _YAML_COMMANDS},
+    **{
+        name: (lambda args, command=command: {'command': command, 'zone_id': args.zone_id})
+        for name, command in _ZONE_COMMANDS.items()
+    },
+}
+
+
+# Fast-path parsing tables: global option -> attribute, and
+# subcommand -> name of its single positional argument (None if no argument)
+_GLOBAL_OPTIONS = {'--service-id': 'service_id', '--broker': 'broker', '--port': 'port'}
+_POSITIONALS: Dict[str, Optional[str]] = {
+    **{name: None for name in _SIMPLE_COMMANDS},
+    **{name: 'config' for name in _YAML_COMMANDS},
+    **{name: 'zone_id' for name in _ZONE_COMMANDS},
+    'batch': 'config',
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse a well-formed command line without building the argparse tree.
+
+    Accepts `[--service-id X] [--broker Y] [--port N] <command> [arg]`
+    (options also as `--opt=value`).
+
+    Args:
+        argv: Arguments (without program name)
+
+    Returns:
+        Namespace shaped like argparse's, or None if argv needs the full
+        parser (help, unknown options, missing or extra arguments)
+    """
+    args = SimpleNamespace(service_id="cam_01", broker="localhost", port=1883)
+    i, n = 0, len(argv)
+
+    # Global options (before the subcommand, as with argparse)
+    while i < n and argv[i].startswith('-'):
+        option, sep, value = argv[i].partition('=')
+        attr = _GLOBAL_OPTIONS.get(option)
+        if attr is None:
+            return None
+        if not sep:
+            i += 1
+            if i == n:
+                return None
+            value = argv[i]
+        setattr(args, attr, value)
+        i += 1
+
+    if i == n or argv[i] not in _POSITIONALS:
+        return None
+    args.command = argv[i]
+    positional = _POSITIONALS[args.command]
+    rest = argv[i + 1:]
+
+    if positional is None:
+        if rest:
+            return None
+    else:
+        if len(rest) != 1 or rest[0].startswith('-'):
+            return None
+        setattr(args, positional, rest[0])
+
+    try:
+        args.port = int(args.port)
+    except ValueError:
+        return None
+
+    return args
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """
+    Build the full CLI argument parser (memoized, built once per process).
+
+    Only used for --help and malformed command lines.
+
+    Returns:
+        Configured ArgumentParser with all subcommands
+    """
+    import argparse
 
-def main():
-    """Main CLI entry point."""
     parser = argparse.ArgumentParser(
         description="Cupertino CLI - Send MQTT commands to StreamProcessor",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -81,6 +334,9 @@ Examples:
   # Change YOLO model
   cupertino-cli set-model config/commands/set_model.yaml
 
+  # Send a list of commands over one connection
+  cupertino-cli batch scripts/commands/batch_add_zones.yaml
+
   # Simple commands (no arguments)
   cupertino-cli pause
   cupertino-cli resume
@@ -131,6 +387,10 @@ Examples:
     set_model = subparsers.add_parser('set-model', help='Change YOLO model from YAML config')
     set_model.add_argument('config', help='Path to model config YAML')
 
+    # batch command
+    batch = subparsers.add_parser('batch', help='Send a list of commands from YAML over one connection')
+    batch.add_argument('config', help='Path to YAML list of commands')
+
     # Simple commands (no arguments)
     subparsers.add_parser('pause', help='Pause stream processing')
     subparsers.add_parser('resume', help='Resume stream processing')
@@ -138,46 +398,30 @@ Examples:
     subparsers.add_parser('health', help='Health check')
     subparsers.add_parser('list-zones', help='List active zones')
 
-    # Parse arguments
-    args = parser.parse_args()
-
-    if not args.command:
-        parser.print_help()
-        sys.exit(1)
-
-    # Execute command
-    try:
-        if args.command == 'add-zone':
-            config = load_yaml_config(args.config)
-            send_command(config, args.service_id, args.broker, args.port)
-
-        elif args.command == 'remove-zone':
-            command = {
-                'command': 'remove_zone',
-                'zone_id': args.zone_id
-            }
-            send_command(command, args.service_id, args.broker, args.port)
+    return parser
 
-        elif args.command == 'enable-zone':
-            command = {
-                'command': 'enable_zone',
-                'zone_id': args.zone_id
-            }
-            send_command(command, args.service_id, args.broker, args.port)
 
-        elif args.command == 'disable-zone':
-            command = {
-                'command': 'disable_zone',
-                'zone_id': args.zone_id
-            }
-            send_command(command, args.service_id, args.broker, args.port)
+def main():
+    """Main CLI entry point."""
+    # Parse arguments (full argparse only for help/usage errors)
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        parser = _build_parser()
+        args = parser.parse_args()
 
-        elif args.command == 'set-model':
-            config = load_yaml_config(args.config)
-            send_command(config, args.service_id, args.broker, args.port)
+        if not args.command:
+            parser.print_help()
+            sys.exit(1)
 
-        elif args.command in ['pause', 'resume', 'status', 'health', 'list-zones']:
-            command = {'command': args.command}
+    # Execute command
+    try:
+        if args.command in _SIMPLE_COMMANDS:
+            send_simple_command(args.command, args.service_id, args.broker, args.port)
+        elif args.command == 'batch':
+            commands = load_batch_config(args.config)
+            send_batch(commands, args.service_id, args.broker, args.port)
+        else:
+            command = _BUILDERS[args.command](args)
             send_command(command, args.service_id, args.broker, args.port)
 
     except Exception as e:
@@ -0,0 +1,318 @@
+"""
+Cupertino CLI daemon - keeps MQTT sessions warm across CLI invocations.
+
+Scripted workflows (CI, ops loops) run `cupertino-cli` many times in a row,
+and each run pays a full TCP + MQTT CONNECT round-trip. The daemon holds one
+long-lived MQTTCommandClient per broker and accepts commands over a Unix
+socket, so each CLI run is a local socket write instead of a new session.
+
+Opt-in: set CUPERTINO_CLI_DAEMON=1. The first CLI call publishes directly
+and spawns the daemon in the background; later calls go through it. The
+daemon exits after IDLE_TIMEOUT seconds without requests.
+
+The socket lives in a private directory ($XDG_RUNTIME_DIR/cupertino-cli,
+or /tmp/cupertino-cli-<uid>) that must be a 0700 directory owned by the
+user, so other local users can't bind it and receive commands.
+
+Wire protocol (one request per connection):
+    client -> daemon: JSON {"broker", "port", "topic", "commands": [...]}, then EOF
+    daemon -> client: b"ok" or b"error <message>"
+
+Usage:
+    cupertino-cli-daemon            # or: python -m cupertino_cli.daemon
+"""
+
+import json
+import os
+import signal
+import socket
+import stat
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Environment switch that routes CLI commands through the daemon
+DAEMON_ENV = "CUPERTINO_CLI_DAEMON"
+
+# Max seconds to reach the daemon before publishing directly
+CONNECT_TIMEOUT = 0.25
+
+# Max seconds to wait for the daemon's reply (covers the PUBACK wait)
+REPLY_TIMEOUT = 10.0
+
+# Seconds between keepalive polls of idle MQTT sessions
+POLL_INTERVAL = 1.0
+
+# Daemon exits after this many seconds without requests
+IDLE_TIMEOUT = 600.0
+
+# Min seconds between daemon spawns (a daemon that can't start isn't
+# respawned by every CLI call)
+SPAWN_BACKOFF = 10.0
+
+
+def enabled() -> bool:
+    """Whether CLI commands should be routed through the daemon."""
+    return os.environ.get(DAEMON_ENV) == "1"
+
+
+def runtime_dir() -> str:
+    """
+    Private per-user directory for the daemon socket, created if missing.
+
+    Uses $XDG_RUNTIME_DIR/cupertino-cli when set, else /tmp/cupertino-cli-<uid>.
+
+    Raises:
+        RuntimeError: If the path isn't a directory owned by this user with
+            mode 0700 (e.g. pre-created by another user in /tmp)
+    """
+    uid = os.getuid()
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    path = (
+        os.path.join(base, "cupertino-cli") if base
+        else f"/tmp/cupertino-cli-{uid}"
+    )
+
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+
+    # lstat: a symlink planted in /tmp is rejected, not followed
+    st = os.lstat(path)
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != uid
+        or stat.S_IMODE(st.st_mode) & 0o077
+    ):
+        raise RuntimeError(
+            f"Unsafe CLI daemon directory {path}: must be a directory "
+            f"owned by uid {uid} with mode 0700"
+        )
+    return path
+
+
+def socket_path() -> str:
+    """Per-user Unix socket path inside runtime_dir()."""
+    return os.path.join(runtime_dir(), "daemon.sock")
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    """Read until the peer shuts down its write side."""
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+# ============================================================
+# Client side (used by cli.py)
+# ============================================================
+
+def spawn() -> None:
+    """
+    Start the daemon in the background, detached from this process.
+
+    At most one spawn per SPAWN_BACKOFF seconds, tracked by the mtime of a
+    stamp file next to the socket.
+    """
+    stamp = os.path.join(runtime_dir(), "spawn.stamp")
+    try:
+        if time.time() - os.stat(stamp).st_mtime < SPAWN_BACKOFF:
+            return
+    except FileNotFoundError:
+        pass
+    with open(stamp, "a"):
+        pass
+    os.utime(stamp)
+
+    subprocess.Popen(
+        [sys.executable, "-m", "cupertino_cli.daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def send(
+    commands: List[Dict[str, Any]],
+    topic: str,
+    broker: str,
+    port: int
+) -> bool:
+    """
+    Send commands through the daemon.
+
+    If no daemon is listening, one is spawned for the next invocation and
+    False is returned so the caller publishes directly.
+
+    Args:
+        commands: Command dictionaries
+        topic: MQTT topic
+        broker: MQTT broker host
+        port: MQTT broker port
+
+    Returns:
+        True if the daemon published the commands, False if the caller
+        must publish them itself
+
+    Raises:
+        RuntimeError: If the daemon failed to publish, didn't reply in
+            time (not retried directly: the commands may have been sent),
+            or the socket directory is unsafe (see runtime_dir())
+    """
+    path = socket_path()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(path)
+    except (FileNotFoundError, ConnectionRefusedError, socket.timeout):
+        sock.close()
+        spawn()
+        return False
+
+    request = {"broker": broker, "port": port, "topic": topic, "commands": commands}
+
+    with sock:
+        try:
+            sock.settimeout(REPLY_TIMEOUT)
+            sock.sendall(json.dumps(request).encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+            reply = _recv_all(sock)
+        except OSError as e:
+            raise RuntimeError(f"CLI daemon did not reply: {e}")
+
+    if reply == b"ok":
+        return True
+    raise RuntimeError(reply.removeprefix(b"error ").decode("utf-8", "replace"))
+
+
+# ============================================================
+# Daemon side
+# ============================================================
+
+def _handle(conn: socket.socket, sessions: Dict[Tuple[str, int], Any]) -> None:
+    """Serve one request: publish its commands on the matching session."""
+    from .mqtt_client import MQTTCommandClient
+
+    with conn:
+        conn.settimeout(REPLY_TIMEOUT)
+        key = None
+        try:
+            request = json.loads(_recv_all(conn))
+            key = (request["broker"], int(request["port"]))
+
+            client = sessions.get(key)
+            if client is None:
+                client = MQTTCommandClient(broker=key[0], port=key[1])
+                client.connect()
+                sessions[key] = client
+
+            client.send_command_batch(request["topic"], request["commands"], qos=1)
+            reply = b"ok"
+        except Exception as e:
+            # Session state is unknown after a failure: start fresh next time
+            client = sessions.pop(key, None)
+            if client is not None:
+                client.disconnect()
+            reply = f"error {e}".encode("utf-8")
+
+        try:
+            conn.sendall(reply)
+        except OSError:
+            pass
+
+
+def serve(path: Optional[str] = None, idle_timeout: float = IDLE_TIMEOUT) -> None:
+    """
+    Run the daemon until idle_timeout elapses without requests.
+
+    Single-threaded: requests are served one at a time, and idle sessions
+    are polled between them so keepalive PINGREQs go out.
+
+    Args:
+        path: Unix socket path (default: socket_path())
+        idle_timeout: Seconds without requests before exiting
+
+    Raises:
+        RuntimeError: If the socket directory is unsafe (see runtime_dir())
+    """
+    path = path or socket_path()
+
+    # Another daemon already listening: nothing to do
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+        probe.close()
+        return
+    except OSError:
+        probe.close()
+
+    # Stale socket file from a daemon that died; one we can't remove isn't
+    # ours to replace
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        return
+
+    # Socket file is created owner-only: no window with wider permissions
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)
+    try:
+        listener.bind(path)
+    except OSError:
+        listener.close()
+        return
+    finally:
+        os.umask(old_umask)
+    listener.listen(16)
+    listener.settimeout(POLL_INTERVAL)
+
+    sessions: Dict[Tuple[str, int], Any] = {}
+    last_request = time.monotonic()
+
+    try:
+        while time.monotonic() - last_request < idle_timeout:
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                pass
+            else:
+                _handle(conn, sessions)
+                last_request = time.monotonic()
+
+            # Keepalive for idle sessions; drop the ones the broker closed
+            for key, client in list(sessions.items()):
+                if not client.poll():
+                    client.disconnect()
+                    del sessions[key]
+    finally:
+        for client in sessions.values():
+            client.disconnect()
+        listener.close()
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def main():
+    """Daemon entry point."""
+    # SIGTERM runs serve()'s cleanup (sessions, socket file) like an exit
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        serve()
+    except RuntimeError as e:
+        sys.exit(f"❌ {e}")
+
+
+if __name__ == '__main__':
+    main()
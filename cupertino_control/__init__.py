@@ -15,7 +15,7 @@ Architecture:
 Design Philosophy:
   - Explicit registration (fail-fast, no runtime surprises)
   - Conditional command registration (based on capabilities)
-  - Thread-safe (registry uses locks)
+  - Thread-safe (registry locks registration, frozen once connected)
   - Clear error messages (lists available commands on error)
 
 References:
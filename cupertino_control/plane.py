@@ -8,6 +8,8 @@ Responsibilities:
   - Status publishing (publish to status topic)
   - Command delegation to CommandRegistry
 
+Protocol: MQTT v5 (ReceiveMaximum advertised on CONNECT)
+
 QoS Policy:
   - Commands: QoS 1 (at-least-once delivery)
   - Status: QoS 1 + retained (last status persisted)
@@ -22,16 +24,33 @@ Inspiration: Adeline control/plane.py
 
 import json
 import logging
+import socket
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from threading import Event
-from typing import Optional
+from typing import Any, Optional
 
 import paho.mqtt.client as mqtt
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.properties import Properties
+
+# orjson is optional: ~3-5x faster, emits bytes and parses bytes directly.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers match.
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
 
 from .registry import CommandRegistry, CommandNotAvailableError
 
 logger = logging.getLogger(__name__)
 
+# MQTT v5 ReceiveMaximum: in-flight QoS 1 messages the broker may send us
+# before waiting for our PUBACKs (pipelined commands aren't serialized)
+RECEIVE_MAXIMUM = 20
+
 
 class MQTTControlPlane:
     """
@@ -40,7 +59,7 @@ class MQTTControlPlane:
     Features:
       - QoS 1 for reliable command delivery
       - Retained status messages (last status persisted)
-      - Event-based connection synchronization
+      - Future-based connection synchronization (carries CONNACK result)
       - CommandRegistry pattern for command execution
 
     Threading:
@@ -95,8 +114,11 @@ class MQTTControlPlane:
         self.status_topic = status_topic
         self.client_id = client_id
 
+        # Status envelope template: only status/timestamp vary per publish
+        self._status_prefix = b'{"client_id":' + _json_dumps(client_id) + b',"status":'
+
         # MQTT client
-        self.client = mqtt.Client(client_id=client_id, protocol=mqtt.MQTTv311)
+        self.client = mqtt.Client(client_id=client_id, protocol=mqtt.MQTTv5)
         self.client.on_connect = self._on_connect
         self.client.on_message = self._on_message
         self.client.on_disconnect = self._on_disconnect
@@ -105,13 +127,19 @@ class MQTTControlPlane:
         if username and password:
             self.client.username_pw_set(username, password)
 
-        # Connection synchronization
-        self._connected = Event()
+        # Connection synchronization: one-shot Future per connect() call,
+        # completed from _on_connect with the CONNACK result
+        self._connect_future: Optional[Future] = None
         self._running = False
 
         # Command registry
         self.command_registry = CommandRegistry()
 
+        # Fast-path dispatch: exact payload bytes of argument-free commands
+        # (e.g. b'{"command":"pause"}') -> command name. Built in connect()
+        # once the registry is frozen.
+        self._simple_payloads: dict[bytes, str] = {}
+
     def connect(self, timeout: float = 5.0) -> bool:
         """
         Connect to MQTT broker with timeout.
@@ -125,70 +153,105 @@ class MQTTControlPlane:
         Thread Safety: Blocks until connected or timeout
         """
         try:
+            # Registration is over once we connect: seal the registry
+            self.command_registry.freeze()
+            self._simple_payloads = {
+                _json_dumps({'command': name}): name
+                for name in self.command_registry.sorted_commands
+            }
+
             logger.info(f"🔌 Connecting to MQTT broker: {self.broker_host}:{self.broker_port}")
-            self.client.connect(self.broker_host, self.broker_port, keepalive=60)
+            self._connect_future = Future()
+            properties = Properties(PacketTypes.CONNECT)
+            properties.ReceiveMaximum = RECEIVE_MAXIMUM
+            self.client.connect(
+                self.broker_host,
+                self.broker_port,
+                keepalive=60,
+                properties=properties,
+            )
             self.client.loop_start()
             self._running = True
 
-            # Wait for connection with timeout
-            if self._connected.wait(timeout=timeout):
-                logger.info("✅ MQTT Control Plane connected")
-                return True
-            else:
-                logger.error(f"❌ Connection timeout after {timeout}s")
-                return False
+            # Wait for CONNACK with timeout (raises if broker refused)
+            self._connect_future.result(timeout=timeout)
+            logger.info("✅ MQTT Control Plane connected")
+            return True
 
+        except FutureTimeoutError:
+            logger.error(f"❌ Connection timeout after {timeout}s")
+            return False
         except Exception as e:
             logger.error(f"❌ Error connecting to MQTT: {e}")
             return False
 
-    def disconnect(self) -> None:
+    def disconnect(self, timeout: float = 2.0) -> None:
         """
         Disconnect from MQTT broker.
 
+        Args:
+            timeout: Max seconds to wait for the final status PUBACK
+
+        Waits (bounded) for the broker to ack the final "disconnected"
+        status before closing, so the last message isn't dropped.
+
         Thread Safety: Safe to call multiple times
         """
         if self._running:
             logger.info("🔌 Disconnecting from MQTT broker")
-            self.publish_status("disconnected")
-            self.client.loop_stop()
+            info = self.publish_status("disconnected")
+            if info is not None:
+                info.wait_for_publish(timeout=timeout)
             self.client.disconnect()
+            self.client.loop_stop()
             self._running = False
-            self._connected.clear()
             logger.info("✅ MQTT Control Plane disconnected")
 
-    def publish_status(self, status: str) -> None:
+    def publish_status(
+        self,
+        status: str,
+        data: Optional[dict] = None,
+    ) -> Optional[mqtt.MQTTMessageInfo]:
         """
         Publish status update to status topic.
 
         Args:
             status: Status string (e.g., "running", "paused", "stopped")
+            data: Optional status details (e.g., {"zone_id": "entrance"})
+
+        Returns:
+            MQTTMessageInfo for the publish (None if publishing failed)
 
         QoS: 1 (at-least-once)
         Retained: True (last status persisted)
 
         Thread Safety: Safe to call from any thread
         """
-        message = {
-            "status": status,
-            "timestamp": datetime.now().isoformat(),
-            "client_id": self.client_id,
-        }
-
         try:
-            self.client.publish(
+            # Concatenate onto the precomputed envelope (no dict + dumps)
+            payload = (
+                self._status_prefix + _json_dumps(status)
+                + b',"timestamp":"' + datetime.now().isoformat().encode('ascii') + b'"'
+            )
+            if data is not None:
+                payload += b',"data":' + _json_dumps(data)
+            payload += b'}'
+
+            info = self.client.publish(
                 self.status_topic,
-                json.dumps(message),
+                payload,
                 qos=1,
                 retain=True,  # Last status retained for new subscribers
             )
             logger.debug(f"📤 Status published: {status}")
+            return info
         except Exception as e:
             logger.error(f"❌ Error publishing status: {e}")
+            return None
 
     # ===== MQTT Callbacks (run in MQTT thread) =====
 
-    def _on_connect(self, client, userdata, flags, rc):
+    def _on_connect(self, client, userdata, flags, rc, properties=None):
         """
         MQTT callback: connection established.
 
@@ -197,6 +260,14 @@ class MQTTControlPlane:
         if rc == 0:
             logger.info(f"✅ Connected to broker (rc={rc})")
 
+            # Commands/status are tiny frames: disable Nagle so they aren't
+            # coalesced behind a pending ACK; QUICKACK is Linux only
+            sock = client.socket()
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if hasattr(socket, 'TCP_QUICKACK'):
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
             # Subscribe to command topic with QoS 1
             client.subscribe(self.command_topic, qos=1)
             logger.info(f"📥 Subscribed to: {self.command_topic} (QoS 1)")
@@ -204,13 +275,17 @@ class MQTTControlPlane:
             # Publish connected status
             self.publish_status("connected")
 
-            # Signal connection event
-            self._connected.set()
+            # Complete pending connect() (no-op on automatic reconnects)
+            future = self._connect_future
+            if future is not None and not future.done():
+                future.set_result(rc)
         else:
             logger.error(f"❌ Connection failed (rc={rc})")
-            self._connected.clear()
+            future = self._connect_future
+            if future is not None and not future.done():
+                future.set_exception(ConnectionError(f"Connection refused (rc={rc})"))
 
-    def _on_disconnect(self, client, userdata, rc):
+    def _on_disconnect(self, client, userdata, rc, properties=None):
         """
         MQTT callback: disconnection detected.
 
@@ -220,7 +295,6 @@ class MQTTControlPlane:
             logger.warning(f"⚠️ Unexpected disconnection (rc={rc})")
         else:
             logger.info("✅ Disconnected from broker")
-        self._connected.clear()
 
     def _on_message(self, client, userdata, msg):
         """
@@ -230,13 +304,21 @@ class MQTTControlPlane:
         Keep this fast! Long-running operations should be delegated.
         """
         try:
-            # Decode payload
-            payload = msg.payload.decode('utf-8')
-            logger.debug(f"📦 Command received: {payload}")
+            payload = msg.payload
+
+            # Decoding to str is only needed for the debug log
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📦 Command received: {payload.decode('utf-8', 'replace')}")
 
-            # Parse JSON
-            command_data = json.loads(payload)
-            command = command_data.get('command', '').lower()
+            # Fast path: argument-free command sent verbatim (one dict
+            # lookup, no JSON parse). Anything else takes the slow path.
+            command = self._simple_payloads.get(payload)
+            if command is not None:
+                command_data = {'command': command}
+            else:
+                # Parse JSON straight from the payload bytes
+                command_data = _json_loads(payload)
+                command = command_data.get('command', '').lower()
 
             if not command:
                 logger.warning("⚠️ Empty command received")
@@ -252,8 +334,7 @@ class MQTTControlPlane:
             except CommandNotAvailableError as e:
                 logger.warning(f"⚠️ {e}")
                 # List available commands to help user
-                available = ', '.join(sorted(self.command_registry.available_commands))
-                logger.info(f"💡 Available commands: {available}")
+                logger.info(f"💡 Available commands: {self.command_registry.help_str}")
 
         except json.JSONDecodeError as e:
             logger.error(f"❌ Error decoding JSON: {msg.payload} ({e})")
@@ -11,12 +11,13 @@ Design Motivation (from Adeline):
   Problem: Optional callbacks make unclear which commands are available
   Solution: Explicit registration pattern
 
-Threading: Thread-safe (uses lock for write operations)
+Threading: Thread-safe (lock for registration, frozen read-only view after freeze())
 Pattern: Registry with explicit registration
 Inspiration: Adeline control/registry.py
 """
 
-from typing import Dict, Callable, Set
+from types import MappingProxyType
+from typing import Dict, Callable, Mapping, Set, Tuple
 import threading
 
 
@@ -37,6 +38,8 @@ class CommandRegistry:
 
     Thread Safety:
       - Uses lock for write operations (register)
+      - freeze() seals the registry once registration is done: commands
+        become a read-only mapping and register() is rejected
       - Read operations are lock-free (immutable dict reads)
 
     Example:
@@ -47,6 +50,9 @@ class CommandRegistry:
         if handler.supports_toggle:
             registry.register('toggle', handler.toggle, "Toggle feature")
 
+        # Seal before the MQTT thread starts dispatching
+        registry.freeze()
+
         # Execute command
         try:
             registry.execute('pause')
@@ -55,9 +61,14 @@ class CommandRegistry:
     """
 
     def __init__(self):
-        self._commands: Dict[str, Callable] = {}
-        self._descriptions: Dict[str, str] = {}
+        self._commands: Mapping[str, Callable] = {}
+        self._descriptions: Mapping[str, str] = {}
         self._lock = threading.Lock()
+        self._frozen = False
+        # Sorted names + joined help string, maintained by register() so the
+        # unknown-command path never re-sorts
+        self._sorted_names: Tuple[str, ...] = ()
+        self._help_str = ''
 
     def register(self, command: str, handler: Callable, description: str) -> None:
         """
@@ -70,15 +81,43 @@ class CommandRegistry:
 
         Raises:
             ValueError: If command already registered (double registration)
+            RuntimeError: If registry is frozen
 
         Thread Safety: Uses lock for write operation
         """
         with self._lock:
+            if self._frozen:
+                raise RuntimeError(
+                    f"Cannot register '{command}': registry is frozen"
+                )
             if command in self._commands:
                 raise ValueError(f"Command '{command}' already registered")
 
             self._commands[command] = handler
             self._descriptions[command] = description
+            self._sorted_names = tuple(sorted(self._commands))
+            self._help_str = ', '.join(self._sorted_names)
+
+    def freeze(self) -> None:
+        """
+        Seal the registry: no more registrations.
+
+        Swaps the command/description dicts for read-only views. Call once registration is
+        complete, before commands start arriving. Idempotent.
+
+        Thread Safety: Uses lock for write operation
+        """
+        with self._lock:
+            if self._frozen:
+                return
+            self._commands = MappingProxyType(dict(self._commands))
+            self._descriptions = MappingProxyType(dict(self._descriptions))
+            self._frozen = True
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether freeze() has been called."""
+        return self._frozen
 
     def execute(self, command: str, command_data: dict = None) -> None:
         """
@@ -93,14 +132,13 @@ class CommandRegistry:
 
         Thread Safety: Read-only operation (no lock needed)
         """
-        if command not in self._commands:
+        handler = self._commands.get(command)
+        if handler is None:
             raise CommandNotAvailableError(
                 f"Command '{command}' not available. "
-                f"Available commands: {', '.join(sorted(self.available_commands))}"
+                f"Available commands: {self._help_str}"
             )
 
-        handler = self._commands[command]
-
         # Call handler with or without command_data
         if command_data is not None:
             handler(command_data)
@@ -125,6 +163,26 @@ class CommandRegistry:
         """
         return set(self._commands.keys())
 
+    @property
+    def sorted_commands(self) -> Tuple[str, ...]:
+        """
+        Get registered command names, sorted.
+
+        Thread Safety: Read-only operation (no lock needed)
+        Returns: Cached tuple (rebuilt only on register)
+        """
+        return self._sorted_names
+
+    @property
+    def help_str(self) -> str:
+        """
+        Get comma-separated sorted command names (for error/help messages).
+
+        Thread Safety: Read-only operation (no lock needed)
+        Returns: Cached string (rebuilt only on register)
+        """
+        return self._help_str
+
     def get_help(self) -> Dict[str, str]:
         """
         Get dict of commands with descriptions.
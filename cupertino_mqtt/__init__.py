@@ -30,9 +30,10 @@ Schemas:
 Publishers:
     DetectionPublisher, ZoneEventPublisher
     BasePublisher (for custom publishers)
+    SharedConnection (one connection for several publishers)
 
 Logging:
-    LogEvent, StructuredLogger, create_logger
+    LogEvent, LogEventId, StructuredLogger, create_logger
 
 Example (Stream Processor):
     >>> from cupertino_mqtt import DetectionPublisher, create_logger
@@ -108,6 +109,7 @@ from .publishers import (
     BasePublisher,
     DetectionPublisher,
     ZoneEventPublisher,
+    SharedConnection,
 )
 
 # Subscriber
@@ -116,6 +118,7 @@ from .subscriber import MessageSubscriber
 # Logging
 from .logging import (
     LogEvent,
+    LogEventId,
     StructuredLogger,
     create_logger,
 )
@@ -140,10 +143,12 @@ __all__ = [
     'BasePublisher',
     'DetectionPublisher',
     'ZoneEventPublisher',
+    'SharedConnection',
     # Subscriber
     'MessageSubscriber',
     # Logging
     'LogEvent',
+    'LogEventId',
     'StructuredLogger',
     'create_logger',
 ]
@@ -0,0 +1,36 @@
+"""
+ISO 8601 Timestamp Formatting
+=============================
+
+Shared UTC formatter for message timestamps (schemas.Timestamp) and
+log records (logging.structured).
+
+Format: naive UTC with microseconds, 'YYYY-MM-DDTHH:MM:SS.ffffff'
+(same as datetime.utcnow().isoformat()).
+"""
+
+import time
+
+# (epoch second, 'YYYY-MM-DDTHH:MM:SS') of the last formatted timestamp.
+# Swapped as one tuple, so concurrent readers never see a torn pair.
+_ts_cache = (-1, '')
+
+
+def format_utc(second: int, micros: int) -> str:
+    """
+    Format an epoch time as ISO 8601 UTC with microseconds.
+
+    The date/time part only changes once per second, so it is formatted
+    once and reused; each call just appends the microseconds. Avoids a
+    datetime allocation + isoformat() per call.
+
+    Args:
+        second: Whole epoch seconds
+        micros: Microseconds within that second (0-999999)
+    """
+    global _ts_cache
+    cached_second, prefix = _ts_cache
+    if second != cached_second:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+        _ts_cache = (second, prefix)
+    return f'{prefix}.{micros:06d}'
@@ -15,6 +15,7 @@ Design:
 Public API
 ----------
     LogEvent: Typed event names (enum)
+    LogEventId: Numeric event ids (IntEnum, grouped by category)
     StructuredLogger: JSON logger implementation
     create_logger: Factory function
 
@@ -38,11 +39,12 @@ Output:
     }
 """
 
-from .events import LogEvent
+from .events import LogEvent, LogEventId
 from .structured import StructuredLogger, create_logger
 
 __all__ = [
     'LogEvent',
+    'LogEventId',
     'StructuredLogger',
     'create_logger',
 ]
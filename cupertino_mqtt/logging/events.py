@@ -24,7 +24,7 @@ Example Log Query (CloudWatch Insights):
     | stats count() by bin(5m)
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class LogEvent(str, Enum):
@@ -97,32 +97,78 @@ class LogEvent(str, Enum):
     """Error during message publication."""
 
 
-# Event categories for filtering
-MQTT_EVENTS = {
+class LogEventId(IntEnum):
+    """
+    Numeric id of each LogEvent, for consumers that key counters or
+    dispatch tables by int (cheaper to hash/compare than the string).
+
+    Ids are grouped in ranges per category, so a category check is a
+    range compare:
+    - 100-199: mqtt.*
+    - 200-299: detection.*
+    - 300-399: zone.*
+    - 900-999: error.*
+
+    Member names match LogEvent; ids are stable (append, never renumber).
+    """
+
+    MQTT_CONNECTED = 100
+    MQTT_DISCONNECTED = 101
+    MQTT_PUBLISH_SUCCESS = 102
+    MQTT_PUBLISH_FAILED = 103
+    MQTT_RECONNECTING = 104
+
+    DETECTION_PROCESSED = 200
+    DETECTION_SERIALIZED = 201
+    DETECTION_RECEIVED = 202
+
+    ZONE_TRIGGERED = 300
+    ZONE_STATS_UPDATED = 301
+    ZONE_EVENT_SERIALIZED = 302
+    ZONE_EVENT_RECEIVED = 303
+
+    SERIALIZATION_ERROR = 900
+    DESERIALIZATION_ERROR = 901
+    SCHEMA_VALIDATION_ERROR = 902
+    MQTT_CONNECTION_ERROR = 903
+    MQTT_PUBLISH_ERROR = 904
+
+
+# Event -> numeric id, precomputed (e.g. counters[EVENT_ID[event]] += 1)
+EVENT_ID = {event: LogEventId[event.name] for event in LogEvent}
+
+
+# Event -> value string, resolved once at import (plain dict lookup instead
+# of the Enum `.value` descriptor on the logging path)
+EVENT_STR = {event: event.value for event in LogEvent}
+
+
+# Event categories for filtering (immutable, safe to share across threads)
+MQTT_EVENTS = frozenset({
     LogEvent.MQTT_CONNECTED,
     LogEvent.MQTT_DISCONNECTED,
     LogEvent.MQTT_PUBLISH_SUCCESS,
     LogEvent.MQTT_PUBLISH_FAILED,
     LogEvent.MQTT_RECONNECTING,
-}
+})
 
-DETECTION_EVENTS = {
+DETECTION_EVENTS = frozenset({
     LogEvent.DETECTION_PROCESSED,
     LogEvent.DETECTION_SERIALIZED,
     LogEvent.DETECTION_RECEIVED,
-}
+})
 
-ZONE_EVENTS = {
+ZONE_EVENTS = frozenset({
     LogEvent.ZONE_TRIGGERED,
     LogEvent.ZONE_STATS_UPDATED,
     LogEvent.ZONE_EVENT_SERIALIZED,
     LogEvent.ZONE_EVENT_RECEIVED,
-}
+})
 
-ERROR_EVENTS = {
+ERROR_EVENTS = frozenset({
     LogEvent.SERIALIZATION_ERROR,
     LogEvent.DESERIALIZATION_ERROR,
     LogEvent.SCHEMA_VALIDATION_ERROR,
     LogEvent.MQTT_CONNECTION_ERROR,
     LogEvent.MQTT_PUBLISH_ERROR,
-}
+})
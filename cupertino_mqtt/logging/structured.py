@@ -11,6 +11,9 @@ Design:
 - Thread-safe (uses standard logging module)
 - Contextual metadata (component, frame_id, etc.)
 - Type-safe events (LogEvent enum)
+- Hot-path friendly: dropped levels return before any formatting, the
+  constant envelope (level, component) is pre-rendered per logger, and
+  the JSON is only rendered when a handler formats the record
 
 Architecture:
 - Wraps Python's logging module
@@ -36,11 +39,86 @@ Output:
     }
 """
 
+import atexit
 import json
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import threading
+import time
 from typing import Dict, Any, Optional
-from .events import LogEvent
+from .events import EVENT_STR, LogEvent
+from .._isotime import format_utc
+
+# orjson is optional: C encoder, ~2x faster than json.dumps on log entries.
+# OPT_NON_STR_KEYS keeps json.dumps' acceptance of int keys in metadata.
+try:
+    import orjson
+
+    def _json_str(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    _json_str = json.dumps
+
+
+def _utc_timestamp(now: Optional[float] = None) -> str:
+    """
+    UTC time as ISO 8601 with microseconds (naive, like utcnow()).
+
+    Args:
+        now: Epoch seconds (default: current time)
+    """
+    if now is None:
+        now = time.time()
+    second = int(now)
+    return format_utc(second, int((now - second) * 1_000_000))
+
+
+# Level name -> logging level (dict lookup, not getattr(logging, ...) per call)
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+}
+
+
+class _StructuredMessage:
+    """
+    Log record message that renders its JSON entry on str().
+
+    The logging module only calls str(record.msg) when a handler formats
+    the record, so records no handler emits never pay for serialization.
+    The timestamp is captured at creation, not at render time.
+    """
+
+    __slots__ = ('created', 'head', 'message', 'metadata', 'exc_info')
+
+    def __init__(self, head, message, metadata, exc_info):
+        self.created = time.time()
+        self.head = head
+        self.message = message
+        self.metadata = metadata
+        self.exc_info = exc_info
+
+    def __str__(self) -> str:
+        # Concatenate onto the pre-rendered envelope (no entry dict + dumps);
+        # key order matches the documented output
+        entry = (
+            '{"timestamp":"' + _utc_timestamp(self.created)
+            + self.head + _json_str(self.message)
+        )
+
+        if self.metadata:
+            entry += ',"metadata":' + _json_str(self.metadata)
+
+        if self.exc_info:
+            entry += ',"exception":' + _json_str({
+                'type': type(self.exc_info).__name__,
+                'message': str(self.exc_info)
+            })
+
+        return entry + '}'
 
 
 class StructuredLogger:
@@ -69,7 +147,8 @@ class StructuredLogger:
         self,
         component: str,
         level: int = logging.INFO,
-        logger_name: Optional[str] = None
+        logger_name: Optional[str] = None,
+        async_output: bool = False
     ):
         """
         Initialize structured logger.
@@ -78,15 +157,29 @@ class StructuredLogger:
             component: Component identifier (e.g., "processor")
             level: Logging level (default: INFO)
             logger_name: Custom logger name (default: cupertino_mqtt.<component>)
+            async_output: Hand records to a background writer thread instead
+                of writing in the calling thread (default: False)
         """
         self.component = component
+
+        # Pre-rendered envelope per level: everything between the timestamp
+        # and the message is constant for a given (level, event), so it is
+        # rendered on first use and cached in the level's heads dict
+        self._component_json = _json_str(component)
+        self._levels = {
+            name: (log_level, {}) for name, log_level in _LEVEL_MAP.items()
+        }
+
         self.logger_name = logger_name or f"cupertino_mqtt.{component}"
         self.logger = logging.getLogger(self.logger_name)
         self.logger.setLevel(level)
 
-        # Configure JSON formatter if not already configured
+        # Configure JSON handler if not already configured
         if not self.logger.handlers:
-            handler = logging.StreamHandler()
+            if async_output:
+                handler = logging.handlers.QueueHandler(_async_writer_queue())
+            else:
+                handler = FastJSONHandler()
             handler.setFormatter(JSONFormatter())
             self.logger.addHandler(handler)
 
@@ -102,37 +195,48 @@ class StructuredLogger:
         Internal log method with structured format.
 
         Args:
-            level: Log level (INFO, WARNING, ERROR)
+            level: Log level (DEBUG, INFO, WARNING, ERROR)
             event: Typed log event
             message: Human-readable message
             metadata: Additional context (frame_id, zone_id, etc.)
             exc_info: Exception for ERROR logs
         """
-        log_entry = {
-            'timestamp': datetime.utcnow().isoformat(),
-            'level': level,
-            'component': self.component,
-            'event': event.value,
-            'message': message,
-        }
+        log_level, heads = self._levels[level]
 
-        if metadata:
-            log_entry['metadata'] = metadata
+        # Dropped records cost one level check: no timestamp, no JSON
+        if not self.logger.isEnabledFor(log_level):
+            return
 
-        if exc_info:
-            log_entry['exception'] = {
-                'type': type(exc_info).__name__,
-                'message': str(exc_info)
-            }
+        head = heads.get(event)
+        if head is None:
+            head = heads[event] = (
+                f'","level":"{level}","component":{self._component_json}'
+                f',"event":{_json_str(EVENT_STR[event])},"message":'
+            )
 
-        # Log as JSON string
-        log_level = getattr(logging, level)
+        # Log a lazy message: JSON is rendered only if a handler formats it
         self.logger.log(
             log_level,
-            json.dumps(log_entry),
-            exc_info=exc_info if level == 'ERROR' else None
+            _StructuredMessage(head, message, metadata, exc_info),
+            exc_info=exc_info if log_level == logging.ERROR else None
         )
 
+    def debug(
+        self,
+        event: LogEvent,
+        message: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Log DEBUG level message (per-message detail, off by default).
+
+        Args:
+            event: Typed log event
+            message: Human-readable message
+            metadata: Additional context
+        """
+        self._log('DEBUG', event, message, metadata)
+
     def info(
         self,
         event: LogEvent,
@@ -208,6 +312,22 @@ class StructuredLogger:
         """
         self._log('ERROR', event, message, metadata, exc_info)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a record at this level would be emitted.
+
+        Hot-path callers use this to skip building metadata (lists,
+        f-strings) for records that would be dropped anyway.
+
+        Args:
+            level: Logging level (logging.DEBUG, INFO, WARNING, ERROR)
+
+        Example:
+            >>> if logger.is_enabled_for(logging.INFO):
+            ...     logger.info(event=..., message=..., metadata=expensive())
+        """
+        return self.logger.isEnabledFor(level)
+
     def set_level(self, level: int) -> None:
         """
         Change logging level dynamically.
@@ -239,15 +359,74 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        # The message from StructuredLogger is already JSON
-        # Just pass it through
+        # The message from StructuredLogger renders itself as JSON
+        # (_StructuredMessage.__str__); serialization happens here
         return record.getMessage()
 
 
+class FastJSONHandler(logging.StreamHandler):
+    """
+    StreamHandler that writes structured records as UTF-8 bytes.
+
+    Records are encoded once and written to the stream's binary buffer
+    with the terminator in a single write, bypassing the text layer
+    (TextIOWrapper encode). Streams without a binary buffer (e.g.
+    io.StringIO) go through the regular StreamHandler path.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Emit a record.
+
+        Args:
+            record: Python logging record
+        """
+        buffer = getattr(self.stream, 'buffer', None)
+        if buffer is None:
+            super().emit(record)
+            return
+
+        try:
+            payload = (self.format(record) + self.terminator).encode('utf-8')
+            # Pending text in the wrapper must go out before our bytes
+            self.stream.flush()
+            buffer.write(payload)
+            buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Shared background writer for async_output loggers: one queue + one
+# thread for the whole process, started on first use
+_async_writer: Optional[logging.handlers.QueueListener] = None
+_async_writer_lock = threading.Lock()
+
+
+def _async_writer_queue() -> queue.SimpleQueue:
+    """
+    Queue of the shared background log writer (started on first call).
+
+    The frame thread only renders and enqueues the record; the write()
+    syscalls happen on the writer thread. Stopped (and drained) at exit.
+    """
+    global _async_writer
+    with _async_writer_lock:
+        if _async_writer is None:
+            handler = FastJSONHandler()
+            handler.setFormatter(JSONFormatter())
+            _async_writer = logging.handlers.QueueListener(queue.SimpleQueue(), handler)
+            _async_writer.start()
+            atexit.register(_async_writer.stop)
+        return _async_writer.queue
+
+
 # Convenience factory function
 def create_logger(
     component: str,
-    level: int = logging.INFO
+    level: int = logging.INFO,
+    async_output: bool = False
 ) -> StructuredLogger:
     """
     Factory function to create configured StructuredLogger.
@@ -255,6 +434,7 @@ def create_logger(
     Args:
         component: Component identifier
         level: Logging level (default: INFO)
+        async_output: Write records from a background thread (default: False)
 
     Returns:
         Configured StructuredLogger instance
@@ -262,4 +442,4 @@ def create_logger(
     Example:
         >>> logger = create_logger("processor", level=logging.DEBUG)
     """
-    return StructuredLogger(component=component, level=level)
+    return StructuredLogger(component=component, level=level, async_output=async_output)
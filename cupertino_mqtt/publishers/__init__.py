@@ -11,6 +11,7 @@ Design:
 - BasePublisher: Abstract base with connection management
 - DetectionPublisher: Publishes detection messages
 - ZoneEventPublisher: Publishes zone event messages
+- SharedConnection: One MQTT connection shared by several publishers
 - Separation of concerns: Publishers format, broker publishes
 
 Public API
@@ -18,6 +19,7 @@ Public API
     BasePublisher: Abstract publisher (for custom publishers)
     DetectionPublisher: Detection message publisher
     ZoneEventPublisher: Zone event message publisher
+    SharedConnection: Shared MQTT connection (one client, one loop thread)
 
 Example:
     >>> from cupertino_mqtt.publishers import DetectionPublisher
@@ -35,6 +37,7 @@ Example:
 """
 
 from .base import BasePublisher
+from .connection import SharedConnection
 from .detection import DetectionPublisher
 from .zone_event import ZoneEventPublisher
 
@@ -42,4 +45,5 @@ __all__ = [
     'BasePublisher',
     'DetectionPublisher',
     'ZoneEventPublisher',
+    'SharedConnection',
 ]
@@ -9,6 +9,9 @@ This module provides the abstract base class for MQTT publishers.
 Design:
 - Connection management (connect, disconnect, reconnect)
 - QoS 0 (fire-and-forget) for high throughput
+- Optional batching: N messages per MQTT publish (JSON array), sent by a
+  background flush thread
+- Optional SharedConnection: several publishers on one paho client
 - Thread-safe (paho-mqtt loop)
 - Structured logging integration
 
@@ -29,13 +32,51 @@ Example:
     ...         return {"my_data": data}
 """
 
+import itertools
 import json
+import logging
 import threading
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Dict, Any, List, Optional, Union
 import paho.mqtt.client as mqtt
 
 from ..logging import StructuredLogger, LogEvent
+from .connection import SharedConnection
+
+
+def _schema_default(obj: Any) -> Any:
+    """
+    Encoder hook for schema objects (DetectionMessage, Detection, ...).
+
+    Lets publish() take a schema object and serialize it in one encoder
+    pass using the object's own wire format (to_dict()), instead of
+    building the dict up front in format_message().
+    """
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+# orjson is optional: C encoder that returns bytes (paho publishes them
+# as-is, no str -> UTF-8 re-encode) and serializes numpy scalars/arrays.
+# Dataclasses are passed through to _schema_default so the schema's wire
+# format (e.g. 'class' for Detection.class_name) is kept.
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_schema_default, option=_ORJSON_OPTIONS)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=_schema_default).encode('utf-8')
 
 
 class BasePublisher(ABC):
@@ -52,6 +93,30 @@ class BasePublisher(ABC):
         client_id: MQTT client identifier
         qos: Quality of Service (default: 0 for high throughput)
         logger: Structured logger instance
+        batch_size: Messages per MQTT publish (1 = no batching)
+        flush_interval_ms: Max time a partial batch waits (0 = size only)
+        log_publish_sample: Log every Nth successful publish (0 = never)
+
+    Batching:
+        With batch_size > 1, publish() queues messages and a background
+        thread sends them as one JSON array per MQTT publish, when
+        batch_size messages are queued or flush_interval_ms elapses.
+        Subscribers receive a list instead of a single object
+        (MessageSubscriber handles both). disconnect() flushes the queue.
+
+    Subscriber Gating:
+        With enable_subscriber_gating=True, the application can report
+        that nobody consumes the topic (set_has_subscribers(False)).
+        publish() then returns True without serializing or sending
+        anything. Only QoS 0, non-retained publishes are gated: the
+        broker may queue QoS 1 for offline persistent sessions, and
+        retained messages are for subscribers that join later.
+
+    Shared Connection:
+        With connection=SharedConnection(...), the publisher uses the
+        shared paho client instead of its own (broker, client_id and
+        credentials come from the connection). connect()/disconnect()
+        join and leave it; the last disconnect() closes it.
 
     Thread Safety:
         Thread-safe via paho-mqtt's loop_start() and threading.Event
@@ -66,7 +131,12 @@ class BasePublisher(ABC):
         logger: StructuredLogger,
         username: Optional[str] = None,
         password: Optional[str] = None,
-        qos: int = 0
+        qos: int = 0,
+        batch_size: int = 1,
+        flush_interval_ms: int = 0,
+        log_publish_sample: int = 0,
+        connection: Optional[SharedConnection] = None,
+        enable_subscriber_gating: bool = False
     ):
         """
         Initialize MQTT publisher.
@@ -80,31 +150,89 @@ class BasePublisher(ABC):
             username: MQTT authentication username (optional)
             password: MQTT authentication password (optional)
             qos: Quality of Service (0=fire-and-forget, 1=at-least-once)
+            batch_size: Messages per MQTT publish (default: 1, no batching)
+            flush_interval_ms: Max wait for a partial batch in ms
+                (default: 0, flush on batch_size or disconnect only)
+            log_publish_sample: Log every Nth successful publish
+                (default: 0, per-publish success logs disabled)
+            connection: Shared connection to publish through (optional;
+                overrides broker_host, broker_port, client_id, credentials)
+            enable_subscriber_gating: Drop QoS 0 publishes while the app
+                reports no subscribers via set_has_subscribers(False)
+                (default: False)
 
         Design Note:
             QoS 0 is default for high-throughput scenarios (25 FPS).
             Use QoS 1 only for critical control messages.
         """
+        if connection is not None:
+            broker_host = connection.broker_host
+            broker_port = connection.broker_port
+            client_id = connection.client_id
+
         self.broker_host = broker_host
         self.broker_port = broker_port
         self.topic = topic
         self.client_id = client_id
         self.logger = logger
         self.qos = qos
+        self._connection = connection
+        # Whether this publisher holds a reference on the shared connection
+        self._acquired = False
+
+        # Constant log fields, built once instead of per callback/publish
+        self._broker_str = (
+            connection._broker_str if connection is not None
+            else f"{broker_host}:{broker_port}"
+        )
+        self._success_meta_base = {'topic': topic, 'qos': qos}
+
+        # Per-publish success logs are observational only: sampled (every
+        # Nth) or off, so the 25 FPS path doesn't pay a JSON log per frame
+        self._publish_log_sample = log_publish_sample
+        self._sample_tick = 0
+
+        if connection is not None:
+            # Shared client: connection state (and its callbacks) live in
+            # the SharedConnection
+            self.client = connection.client
+            self._connected = connection.connected
+        else:
+            # MQTT client setup
+            self.client = mqtt.Client(client_id=client_id)
+            if username and password:
+                self.client.username_pw_set(username, password)
+
+            # Callbacks
+            self.client.on_connect = self._on_connect
+            self.client.on_disconnect = self._on_disconnect
+
+            # Connection state
+            self._connected = threading.Event()
+
+        # Published-message counter without a lock: itertools.count's
+        # __next__ runs in C and is atomic under the GIL. _message_count
+        # holds the latest value for stats and logs.
+        self._message_counter = itertools.count(1)
+        self._message_count = 0
 
-        # MQTT client setup
-        self.client = mqtt.Client(client_id=client_id)
-        if username and password:
-            self.client.username_pw_set(username, password)
+        # Confirms are asynchronous: publish() never waits for the broker.
+        # Only the last publish is tracked, so disconnect() can drain
+        # in-flight messages (paho completes them in order)
+        self._last_info: Optional[mqtt.MQTTMessageInfo] = None
 
-        # Callbacks
-        self.client.on_connect = self._on_connect
-        self.client.on_disconnect = self._on_disconnect
+        # Subscriber gating: _gated is the single flag publish() checks
+        self._subscriber_gating = enable_subscriber_gating
+        self._has_subscribers = True
+        self._gated = False
 
-        # Connection state
-        self._connected = threading.Event()
-        self._message_count = 0
-        self._stats_lock = threading.Lock()
+        # Batching state (flush thread started in connect())
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self._batch: deque = deque()
+        self._batch_cond = threading.Condition()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_running = False
 
     def _on_connect(
         self,
@@ -126,9 +254,9 @@ class BasePublisher(ABC):
             self._connected.set()
             self.logger.info(
                 event=LogEvent.MQTT_CONNECTED,
-                message=f"Connected to MQTT broker",
+                message="Connected to MQTT broker",
                 metadata={
-                    'broker': f"{self.broker_host}:{self.broker_port}",
+                    'broker': self._broker_str,
                     'client_id': self.client_id,
                     'topic': self.topic
                 }
@@ -137,7 +265,7 @@ class BasePublisher(ABC):
             self.logger.error(
                 event=LogEvent.MQTT_CONNECTION_ERROR,
                 message=f"Failed to connect to broker (rc={rc})",
-                metadata={'broker': f"{self.broker_host}:{self.broker_port}"}
+                metadata={'broker': self._broker_str}
             )
 
     def _on_disconnect(
@@ -159,7 +287,7 @@ class BasePublisher(ABC):
             event=LogEvent.MQTT_DISCONNECTED,
             message="Disconnected from MQTT broker",
             metadata={
-                'broker': f"{self.broker_host}:{self.broker_port}",
+                'broker': self._broker_str,
                 'reason_code': rc
             }
         )
@@ -179,12 +307,25 @@ class BasePublisher(ABC):
             >>> if publisher.connect():
             ...     publisher.publish(message)
         """
+        if self._connection is not None:
+            # One reference per publisher, however often connect() is called
+            if self._acquired:
+                return True
+            if not self._connection.acquire(timeout):
+                return False
+            self._acquired = True
+            if self.batch_size > 1:
+                self._start_flush_thread()
+            return True
+
         try:
             self.client.connect(self.broker_host, self.broker_port)
             self.client.loop_start()
 
             # Wait for connection with timeout
             if self._connected.wait(timeout=timeout):
+                if self.batch_size > 1:
+                    self._start_flush_thread()
                 return True
             else:
                 self.logger.error(
@@ -199,19 +340,37 @@ class BasePublisher(ABC):
                 event=LogEvent.MQTT_CONNECTION_ERROR,
                 message="Failed to connect to broker",
                 exc_info=e,
-                metadata={'broker': f"{self.broker_host}:{self.broker_port}"}
+                metadata={'broker': self._broker_str}
             )
             return False
 
-    def disconnect(self) -> None:
+    def disconnect(self, drain_timeout: float = 2.0) -> None:
         """
         Disconnect from MQTT broker gracefully.
 
-        Stops the network loop and disconnects the client.
+        Flushes queued batches and waits (bounded) until the last publish
+        has gone out (QoS 0: written to the socket; QoS 1: PUBACKed),
+        then stops the network loop and disconnects the client (with a
+        shared connection: leaves it, and only the last publisher closes
+        it).
+
+        Args:
+            drain_timeout: Max seconds to wait for in-flight messages
         """
         try:
-            self.client.loop_stop()
-            self.client.disconnect()
+            self._stop_flush_thread()
+            info = self._last_info
+            if info is not None and self._connected.is_set():
+                info.wait_for_publish(timeout=drain_timeout)
+            if self._connection is not None:
+                # Only release a reference this publisher holds (connect()
+                # may have failed, or disconnect() already run)
+                if self._acquired:
+                    self._acquired = False
+                    self._connection.release()
+            else:
+                self.client.loop_stop()
+                self.client.disconnect()
             self.logger.info(
                 event=LogEvent.MQTT_DISCONNECTED,
                 message="Disconnected from broker",
@@ -246,22 +405,25 @@ class BasePublisher(ABC):
 
     def publish(
         self,
-        message_data: Dict[str, Any],
+        message_data: Union[Dict[str, Any], Any],
         retain: bool = False
     ) -> bool:
         """
         Publish message to MQTT broker.
 
         Args:
-            message_data: Message dictionary (already formatted)
+            message_data: Message dictionary (already formatted), or a
+                schema object with to_dict() (serialized directly)
             retain: MQTT retain flag (default: False)
 
         Returns:
-            True if published successfully, False otherwise
+            True if published successfully (or queued, when batching),
+            False otherwise
 
         Design Note:
-            This method accepts pre-formatted dictionaries. Subclasses
-            should call format_message() before calling publish().
+            This method accepts pre-formatted dictionaries or schema
+            objects; the latter skip the separate format step.
+            Retained messages are never batched.
         """
         if not self._connected.is_set():
             self.logger.warning(
@@ -270,46 +432,199 @@ class BasePublisher(ABC):
             )
             return False
 
+        # Nobody listens: skip the serialize + send entirely
+        if self._gated and not retain:
+            return True
+
+        if self._flush_running and not retain:
+            with self._batch_cond:
+                self._batch.append(message_data)
+                if len(self._batch) >= self.batch_size:
+                    self._batch_cond.notify()
+            return True
+
         try:
-            # Serialize to JSON
-            json_message = json.dumps(message_data)
-
-            # Publish
-            result = self.client.publish(
-                topic=self.topic,
-                payload=json_message,
-                qos=self.qos,
-                retain=retain
+            # Serialize to JSON (bytes)
+            json_message = self._encode(message_data)
+            return self._send(json_message, retain, 1)
+
+        except Exception as e:
+            self.logger.error(
+                event=LogEvent.MQTT_PUBLISH_ERROR,
+                message="Error publishing message",
+                exc_info=e,
+                metadata={'topic': self.topic}
+            )
+            return False
+
+    def publish_batch(self, messages: List[Any]) -> bool:
+        """
+        Publish several messages as one JSON array, in one MQTT publish.
+
+        Sent immediately, independent of batch_size (messages queued for
+        the flush thread are not included).
+
+        Args:
+            messages: Message dictionaries or schema objects
+
+        Returns:
+            True if published successfully (or nothing to send), False
+            otherwise
+        """
+        if not self._connected.is_set():
+            self.logger.warning(
+                event=LogEvent.MQTT_PUBLISH_FAILED,
+                message="Cannot publish: not connected to broker"
             )
+            return False
+
+        if self._gated or not messages:
+            return True
+
+        return self._publish_batch(messages)
+
+    def set_has_subscribers(self, has_subscribers: bool) -> None:
+        """
+        Report whether anything consumes this publisher's topic.
 
-            if result.rc == mqtt.MQTT_ERR_SUCCESS:
-                with self._stats_lock:
-                    self._message_count += 1
+        Only takes effect with enable_subscriber_gating=True and QoS 0.
 
+        Args:
+            has_subscribers: False to drop publishes until set back to True
+        """
+        self._has_subscribers = has_subscribers
+        self._gated = (
+            self._subscriber_gating and not has_subscribers and self.qos == 0
+        )
+
+    def _encode(self, message_data: Any) -> bytes:
+        """
+        Serialize one message to JSON bytes.
+
+        Subclasses may override with a specialized encoder for their
+        message type (falling back to this one).
+        """
+        return _json_dumps(message_data)
+
+    def _send(self, payload: bytes, retain: bool, count: int) -> bool:
+        """
+        Publish a serialized payload carrying `count` messages.
+
+        Returns:
+            True if paho accepted the publish, False otherwise
+        """
+        result = self.client.publish(
+            topic=self.topic,
+            payload=payload,
+            qos=self.qos,
+            retain=retain
+        )
+
+        if result.rc == mqtt.MQTT_ERR_SUCCESS:
+            self._last_info = result
+            for _ in range(count):
+                total = next(self._message_counter)
+            self._message_count = total
+
+            # Sampled: log when message_count crosses a multiple of N
+            n = self._publish_log_sample
+            if (
+                n and total // n != (total - count) // n
+                and self.logger.is_enabled_for(logging.INFO)
+            ):
+                metadata = self._success_meta_base.copy()
+                metadata['message_count'] = total
                 self.logger.info(
                     event=LogEvent.MQTT_PUBLISH_SUCCESS,
                     message="Published message",
-                    metadata={
-                        'topic': self.topic,
-                        'message_count': self._message_count,
-                        'qos': self.qos
-                    }
-                )
-                return True
-            else:
-                self.logger.warning(
-                    event=LogEvent.MQTT_PUBLISH_FAILED,
-                    message=f"Publish failed (rc={result.rc})",
-                    metadata={'topic': self.topic}
+                    metadata=metadata
                 )
-                return False
+            return True
+        else:
+            self.logger.warning(
+                event=LogEvent.MQTT_PUBLISH_FAILED,
+                message=f"Publish failed (rc={result.rc})",
+                metadata={'topic': self.topic}
+            )
+            return False
+
+    def _publish_log_due(self) -> bool:
+        """
+        Sampling gate for subclasses' per-publish logs.
 
+        Returns True on every Nth call (N = log_publish_sample) when INFO
+        is enabled; always False when sampling is off. The tick is a
+        plain int: a lost increment under contention only shifts the
+        sample.
+        """
+        n = self._publish_log_sample
+        if not n:
+            return False
+        self._sample_tick += 1
+        return self._sample_tick % n == 0 and self.logger.is_enabled_for(logging.INFO)
+
+    # ===== Batching (flush thread) =====
+
+    def _start_flush_thread(self) -> None:
+        """Start the background flush thread (no-op if already running)."""
+        if self._flush_thread is not None:
+            return
+        self._flush_running = True
+        self._flush_thread = threading.Thread(
+            target=self._flush_loop,
+            name=f"{self.client_id}-flush",
+            daemon=True
+        )
+        self._flush_thread.start()
+
+    def _stop_flush_thread(self) -> None:
+        """Stop the flush thread after it has sent everything queued."""
+        if self._flush_thread is None:
+            return
+        with self._batch_cond:
+            self._flush_running = False
+            self._batch_cond.notify()
+        self._flush_thread.join()
+        self._flush_thread = None
+
+    def _flush_loop(self) -> None:
+        """
+        Flush thread: send queued messages as JSON arrays.
+
+        Wakes when a full batch is queued, when flush_interval_ms elapses
+        (partial batch), or on stop (drains the queue, then exits).
+        """
+        timeout = self.flush_interval_ms / 1000 if self.flush_interval_ms > 0 else None
+
+        while True:
+            with self._batch_cond:
+                if self._flush_running and len(self._batch) < self.batch_size:
+                    self._batch_cond.wait(timeout)
+                count = min(len(self._batch), self.batch_size)
+                batch = [self._batch.popleft() for _ in range(count)]
+                running = self._flush_running
+
+            if batch:
+                self._publish_batch(batch)
+            elif not running:
+                return
+
+    def _publish_batch(self, batch: List[Any]) -> bool:
+        """Serialize a batch as one JSON array and publish it."""
+        try:
+            # Interleave separators so the payload is built by a single
+            # join (one allocation, no '[' + ... + ']' copies)
+            parts = [b','] * (2 * len(batch) + 1)
+            parts[0] = b'['
+            parts[1::2] = map(self._encode, batch)
+            parts[-1] = b']'
+            return self._send(b''.join(parts), False, len(batch))
         except Exception as e:
             self.logger.error(
                 event=LogEvent.MQTT_PUBLISH_ERROR,
-                message="Error publishing message",
+                message="Error publishing message batch",
                 exc_info=e,
-                metadata={'topic': self.topic}
+                metadata={'topic': self.topic, 'batch_size': len(batch)}
             )
             return False
 
@@ -324,10 +639,9 @@ class BasePublisher(ABC):
             >>> stats = publisher.get_stats()
             >>> print(f"Published {stats['message_count']} messages")
         """
-        with self._stats_lock:
-            return {
-                'message_count': self._message_count,
-                'connected': self._connected.is_set(),
-                'topic': self.topic,
-                'broker': f"{self.broker_host}:{self.broker_port}"
-            }
+        return {
+            'message_count': self._message_count,
+            'connected': self._connected.is_set(),
+            'topic': self.topic,
+            'broker': self._broker_str
+        }
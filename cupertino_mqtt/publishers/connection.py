@@ -0,0 +1,179 @@
+"""
+Shared MQTT Connection
+======================
+
+Bounded Context: MQTT Infrastructure
+
+One paho client (one TCP connection, one network loop thread) shared by
+several publishers.
+
+Design:
+- A processor publishing detections and zone events otherwise runs two
+  clients: two sockets and two loop threads doing the same work
+- Publishers call client.publish() directly (paho's publish is
+  thread-safe), so no extra queue or thread hop
+- Reference counted: the first publisher's connect() opens the
+  connection, the last publisher's disconnect() closes it
+
+Example:
+    >>> connection = SharedConnection(
+    ...     broker_host="localhost",
+    ...     client_id="processor_01",
+    ...     logger=logger
+    ... )
+    >>> detections = DetectionPublisher(..., connection=connection)
+    >>> zones = ZoneEventPublisher(..., connection=connection)
+    >>> detections.connect()  # opens the shared connection
+    >>> zones.connect()       # already open: just joins
+"""
+
+import threading
+from typing import Any, Dict, Optional
+import paho.mqtt.client as mqtt
+
+from ..logging import StructuredLogger, LogEvent
+
+
+class SharedConnection:
+    """
+    MQTT connection shared by several publishers.
+
+    Attributes:
+        broker_host: MQTT broker hostname
+        broker_port: MQTT broker port
+        client_id: MQTT client identifier
+        logger: Structured logger instance
+        client: Underlying paho client (used by the publishers)
+
+    Thread Safety:
+        acquire()/release() are serialized by a lock; publishing is
+        thread-safe via paho-mqtt.
+    """
+
+    def __init__(
+        self,
+        broker_host: str,
+        client_id: str,
+        logger: StructuredLogger,
+        broker_port: int = 1883,
+        username: Optional[str] = None,
+        password: Optional[str] = None
+    ):
+        """
+        Initialize shared connection (does not connect).
+
+        Args:
+            broker_host: MQTT broker hostname
+            client_id: Unique client identifier
+            logger: Structured logger for observability
+            broker_port: MQTT broker port (default: 1883)
+            username: MQTT authentication username (optional)
+            password: MQTT authentication password (optional)
+        """
+        self.broker_host = broker_host
+        self.broker_port = broker_port
+        self.client_id = client_id
+        self.logger = logger
+        self._broker_str = f"{broker_host}:{broker_port}"
+
+        self.client = mqtt.Client(client_id=client_id)
+        if username and password:
+            self.client.username_pw_set(username, password)
+        self.client.on_connect = self._on_connect
+        self.client.on_disconnect = self._on_disconnect
+
+        # Shared with the publishers: their is_connected()/publish() checks
+        # read this event directly
+        self.connected = threading.Event()
+
+        self._lock = threading.Lock()
+        self._users = 0
+
+    def _on_connect(
+        self,
+        client: mqtt.Client,
+        userdata: Any,
+        flags: Dict[str, Any],
+        rc: int
+    ) -> None:
+        """Callback when connection established."""
+        if rc == 0:
+            self.connected.set()
+            self.logger.info(
+                event=LogEvent.MQTT_CONNECTED,
+                message="Connected to MQTT broker",
+                metadata={
+                    'broker': self._broker_str,
+                    'client_id': self.client_id
+                }
+            )
+        else:
+            self.logger.error(
+                event=LogEvent.MQTT_CONNECTION_ERROR,
+                message=f"Failed to connect to broker (rc={rc})",
+                metadata={'broker': self._broker_str}
+            )
+
+    def _on_disconnect(
+        self,
+        client: mqtt.Client,
+        userdata: Any,
+        rc: int
+    ) -> None:
+        """Callback when disconnected from broker."""
+        self.connected.clear()
+        self.logger.warning(
+            event=LogEvent.MQTT_DISCONNECTED,
+            message="Disconnected from MQTT broker",
+            metadata={
+                'broker': self._broker_str,
+                'reason_code': rc
+            }
+        )
+
+    def acquire(self, timeout: float = 10.0) -> bool:
+        """
+        Join the connection, opening it if this is the first user.
+
+        Args:
+            timeout: Connection timeout in seconds
+
+        Returns:
+            True if connected, False otherwise (the caller is not counted
+            as a user and must not call release())
+        """
+        with self._lock:
+            if self._users == 0:
+                try:
+                    self.client.connect(self.broker_host, self.broker_port)
+                    self.client.loop_start()
+                except Exception as e:
+                    self.logger.error(
+                        event=LogEvent.MQTT_CONNECTION_ERROR,
+                        message="Failed to connect to broker",
+                        exc_info=e,
+                        metadata={'broker': self._broker_str}
+                    )
+                    return False
+
+                if not self.connected.wait(timeout=timeout):
+                    self.client.loop_stop()
+                    self.logger.error(
+                        event=LogEvent.MQTT_CONNECTION_ERROR,
+                        message="Connection timeout",
+                        metadata={'timeout': timeout}
+                    )
+                    return False
+
+            self._users += 1
+            return True
+
+    def release(self) -> None:
+        """Leave the connection, closing it if this was the last user."""
+        with self._lock:
+            if self._users == 0:
+                return
+            self._users -= 1
+            if self._users == 0:
+                self.client.loop_stop()
+                self.client.disconnect()
@@ -49,8 +49,11 @@ Example:
     >>> publisher.publish_detection(msg)
 """
 
+import logging
 from typing import Dict, Any, Optional
 from .base import BasePublisher
+from .connection import SharedConnection
+from .encoder import encode_detection_message
 from ..schemas import DetectionMessage
 from ..logging import StructuredLogger, LogEvent
 
@@ -84,7 +87,12 @@ class DetectionPublisher(BasePublisher):
         client_id: str = "cupertino_detection_publisher",
         username: Optional[str] = None,
         password: Optional[str] = None,
-        qos: int = 0
+        qos: int = 0,
+        batch_size: int = 1,
+        flush_interval_ms: int = 0,
+        log_publish_sample: int = 0,
+        connection: Optional[SharedConnection] = None,
+        enable_subscriber_gating: bool = False
     ):
         """
         Initialize detection publisher.
@@ -98,6 +106,11 @@ class DetectionPublisher(BasePublisher):
             username: MQTT auth username (optional)
             password: MQTT auth password (optional)
             qos: Quality of Service (default: 0)
+            batch_size: Messages per MQTT publish (default: 1, no batching)
+            flush_interval_ms: Max wait for a partial batch in ms (default: 0)
+            log_publish_sample: Log every Nth publish (default: 0, disabled)
+            connection: Shared connection to publish through (optional)
+            enable_subscriber_gating: Honor set_has_subscribers() (default: False)
         """
         super().__init__(
             broker_host=broker_host,
@@ -107,10 +120,26 @@ class DetectionPublisher(BasePublisher):
             logger=logger,
             username=username,
             password=password,
-            qos=qos
+            qos=qos,
+            batch_size=batch_size,
+            flush_interval_ms=flush_interval_ms,
+            log_publish_sample=log_publish_sample,
+            connection=connection,
+            enable_subscriber_gating=enable_subscriber_gating
         )
         self.schema_version = "1.0"
 
+    def _encode(self, message_data: Any) -> bytes:
+        """
+        Serialize a message, using the specialized DetectionMessage
+        encoder when it applies (generic encoder otherwise).
+        """
+        if type(message_data) is DetectionMessage:
+            payload = encode_detection_message(message_data)
+            if payload is not None:
+                return payload
+        return super()._encode(message_data)
+
     def format_message(self, detection_msg: DetectionMessage) -> Dict[str, Any]:
         """
         Format DetectionMessage to JSON-compatible dict.
@@ -132,15 +161,17 @@ class DetectionPublisher(BasePublisher):
         try:
             formatted = detection_msg.to_dict()
 
-            self.logger.info(
-                event=LogEvent.DETECTION_SERIALIZED,
-                message=f"Serialized detection message",
-                metadata={
-                    'frame_id': detection_msg.frame_id,
-                    'detection_count': detection_msg.detection_count,
-                    'source_id': detection_msg.source_id
-                }
-            )
+            # Per-message detail: DEBUG only (INFO at 30 fps floods the log)
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    event=LogEvent.DETECTION_SERIALIZED,
+                    message="Serialized detection message",
+                    metadata={
+                        'frame_id': detection_msg.frame_id,
+                        'detection_count': detection_msg.detection_count,
+                        'source_id': detection_msg.source_id
+                    }
+                )
 
             return formatted
 
@@ -176,20 +207,19 @@ class DetectionPublisher(BasePublisher):
             >>> success = publisher.publish_detection(msg)
         """
         try:
-            # Format message
-            message_data = self.format_message(detection_msg)
-
-            # Publish via base class
-            success = self.publish(message_data)
+            # Publish the message object: serialized in one encoder pass
+            # (no intermediate dict from format_message)
+            success = self.publish(detection_msg)
 
-            if success:
+            if success and self._publish_log_due():
+                tracker_ids = detection_msg.get_tracker_ids()
                 self.logger.info(
                     event=LogEvent.DETECTION_PROCESSED,
-                    message=f"Published {detection_msg.detection_count} detections",
+                    message="Published detections",
                     metadata={
                         'frame_id': detection_msg.frame_id,
-                        'detection_count': detection_msg.detection_count,
-                        'tracker_ids': detection_msg.get_tracker_ids()
+                        'detection_count': len(tracker_ids),
+                        'tracker_ids': tracker_ids
                     }
                 )
 
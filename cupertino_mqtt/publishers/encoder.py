@@ -0,0 +1,99 @@
+"""
+Detection Message Encoder
+=========================
+
+Bounded Context: Message Production (serialization hot path)
+
+Specialized JSON encoder for DetectionMessage.
+
+Design:
+- Renders each detection through one %-format template: no per-box
+  dicts (to_dict / asdict) and no generic encoder walk
+- Class names are JSON-encoded once and cached (small, fixed vocabulary)
+- schema_version (near-constant) is JSON-encoded once per value
+- Same wire format (and key order) as to_dict() + json.dumps
+- Plain int/float fields only: anything else (numpy scalars, NaN/inf,
+  bools) returns None and the caller falls back to the generic encoder
+
+Example:
+    >>> payload = encode_detection_message(msg)
+    >>> if payload is None:
+    ...     payload = json.dumps(msg.to_dict()).encode('utf-8')
+"""
+
+import json
+from typing import Dict, Optional
+
+from ..schemas import DetectionMessage
+
+_HEAD = '{"schema_version":%s,"timestamp":%s,"frame_id":%d,"source_id":%d,"detections":['
+
+# %r on int/float gives the same text json.dumps does for finite values
+_DETECTION = (
+    '{"tracker_id":%d,"class":%s,"confidence":%r,'
+    '"bbox":{"x":%r,"y":%r,"width":%r,"height":%r}}'
+)
+
+# class_name -> JSON string literal (e.g. 'person' -> '"person"')
+_class_json: Dict[str, str] = {}
+
+# schema_version -> JSON string literal
+_version_json: Dict[str, str] = {}
+
+
+def _plain(value) -> bool:
+    """Whether %r renders value as valid JSON (int, or finite float)."""
+    kind = type(value)
+    # x - x is NaN for inf/NaN, so the compare rejects them
+    return kind is int or (kind is float and value - value == 0.0)
+
+
+def encode_detection_message(msg: DetectionMessage) -> Optional[bytes]:
+    """
+    Encode a DetectionMessage as JSON bytes.
+
+    Args:
+        msg: DetectionMessage instance
+
+    Returns:
+        UTF-8 JSON payload, or None if a field isn't a plain int/float
+        (caller should use the generic encoder)
+    """
+    if type(msg.frame_id) is not int or type(msg.source_id) is not int:
+        return None
+
+    version_json = _version_json.get(msg.schema_version)
+    if version_json is None:
+        version_json = _version_json[msg.schema_version] = json.dumps(msg.schema_version)
+
+    parts = [_HEAD % (
+        version_json,
+        json.dumps(msg.timestamp.to_dict()),
+        msg.frame_id,
+        msg.source_id,
+    )]
+
+    for det in msg.detections:
+        bbox = det.bbox
+        if not (
+            type(det.tracker_id) is int
+            and _plain(det.confidence)
+            and _plain(bbox.x) and _plain(bbox.y)
+            and _plain(bbox.width) and _plain(bbox.height)
+        ):
+            return None
+
+        class_json = _class_json.get(det.class_name)
+        if class_json is None:
+            class_json = _class_json[det.class_name] = json.dumps(det.class_name)
+
+        parts.append(_DETECTION % (
+            det.tracker_id, class_json, det.confidence,
+            bbox.x, bbox.y, bbox.width, bbox.height,
+        ))
+        parts.append(',')
+
+    if len(parts) > 1:
+        parts.pop()  # trailing comma
+    parts.append(']}')
+    return ''.join(parts).encode('utf-8')
@@ -53,8 +53,10 @@ Example:
     >>> publisher.publish_zone_event(msg)
 """
 
-from typing import Dict, Any, Optional
+import logging
+from typing import Dict, Any, List, Optional
 from .base import BasePublisher
+from .connection import SharedConnection
 from ..schemas import ZoneEventMessage
 from ..logging import StructuredLogger, LogEvent
 
@@ -88,7 +90,12 @@ class ZoneEventPublisher(BasePublisher):
         client_id: str = "cupertino_zone_publisher",
         username: Optional[str] = None,
         password: Optional[str] = None,
-        qos: int = 0
+        qos: int = 0,
+        batch_size: int = 1,
+        flush_interval_ms: int = 0,
+        log_publish_sample: int = 0,
+        connection: Optional[SharedConnection] = None,
+        enable_subscriber_gating: bool = False
     ):
         """
         Initialize zone event publisher.
@@ -102,6 +109,11 @@ class ZoneEventPublisher(BasePublisher):
             username: MQTT auth username (optional)
             password: MQTT auth password (optional)
             qos: Quality of Service (default: 0)
+            batch_size: Messages per MQTT publish (default: 1, no batching)
+            flush_interval_ms: Max wait for a partial batch in ms (default: 0)
+            log_publish_sample: Log every Nth publish (default: 0, disabled)
+            connection: Shared connection to publish through (optional)
+            enable_subscriber_gating: Honor set_has_subscribers() (default: False)
         """
         super().__init__(
             broker_host=broker_host,
@@ -111,7 +123,12 @@ class ZoneEventPublisher(BasePublisher):
             logger=logger,
             username=username,
             password=password,
-            qos=qos
+            qos=qos,
+            batch_size=batch_size,
+            flush_interval_ms=flush_interval_ms,
+            log_publish_sample=log_publish_sample,
+            connection=connection,
+            enable_subscriber_gating=enable_subscriber_gating
         )
         self.schema_version = "1.0"
 
@@ -136,15 +153,17 @@ class ZoneEventPublisher(BasePublisher):
         try:
             formatted = zone_event_msg.to_dict()
 
-            self.logger.info(
-                event=LogEvent.ZONE_EVENT_SERIALIZED,
-                message=f"Serialized zone event message",
-                metadata={
-                    'frame_id': zone_event_msg.frame_id,
-                    'zone_count': zone_event_msg.zone_count,
-                    'source_id': zone_event_msg.source_id
-                }
-            )
+            # Per-message detail: DEBUG only (INFO at 30 fps floods the log)
+            if self.logger.is_enabled_for(logging.DEBUG):
+                self.logger.debug(
+                    event=LogEvent.ZONE_EVENT_SERIALIZED,
+                    message="Serialized zone event message",
+                    metadata={
+                        'frame_id': zone_event_msg.frame_id,
+                        'zone_count': zone_event_msg.zone_count,
+                        'source_id': zone_event_msg.source_id
+                    }
+                )
 
             return formatted
 
@@ -180,25 +199,31 @@ class ZoneEventPublisher(BasePublisher):
             >>> success = publisher.publish_zone_event(msg)
         """
         try:
-            # Format message
-            message_data = self.format_message(zone_event_msg)
-
-            # Publish via base class
-            success = self.publish(message_data)
+            # Publish the message object: serialized in one encoder pass
+            # (no intermediate dict from format_message)
+            success = self.publish(zone_event_msg)
 
-            if success:
-                # Extract zone IDs for logging
-                zone_ids = [zone.zone_id for zone in zone_event_msg.zones]
+            if success and self._publish_log_due():
+                # Only zones with objects in them: an idle frame has nothing
+                # to report (count comes from the same list). Built fresh, not
+                # in a reused buffer: the log record keeps a reference to the
+                # metadata and renders it later (async writer thread), and it
+                # is only built on sampled publishes anyway
+                zone_ids = [
+                    zone.zone_id for zone in zone_event_msg.zones
+                    if zone.triggered_by
+                ]
 
-                self.logger.info(
-                    event=LogEvent.ZONE_TRIGGERED,
-                    message=f"Published {zone_event_msg.zone_count} zone events",
-                    metadata={
-                        'frame_id': zone_event_msg.frame_id,
-                        'zone_count': zone_event_msg.zone_count,
-                        'zone_ids': zone_ids
-                    }
-                )
+                if zone_ids:
+                    self.logger.info(
+                        event=LogEvent.ZONE_TRIGGERED,
+                        message="Published zone events",
+                        metadata={
+                            'frame_id': zone_event_msg.frame_id,
+                            'zone_count': len(zone_ids),
+                            'zone_ids': zone_ids
+                        }
+                    )
 
             return success
 
@@ -213,3 +238,35 @@ class ZoneEventPublisher(BasePublisher):
                 }
             )
             return False
+
+    def publish_zone_events_batch(self, zone_event_msgs: List[ZoneEventMessage]) -> bool:
+        """
+        Publish several zone event messages in one MQTT publish.
+
+        The payload is a JSON array of messages (MessageSubscriber accepts
+        both arrays and single messages). Use it when frames are buffered
+        upstream: one broker round-trip per batch instead of per frame.
+
+        Args:
+            zone_event_msgs: ZoneEventMessage instances, in frame order
+
+        Returns:
+            True if published successfully, False otherwise
+
+        Example:
+            >>> success = publisher.publish_zone_events_batch([msg1, msg2, msg3])
+        """
+        success = self.publish_batch(zone_event_msgs)
+
+        if success and zone_event_msgs and self._publish_log_due():
+            self.logger.info(
+                event=LogEvent.ZONE_TRIGGERED,
+                message="Published zone event batch",
+                metadata={
+                    'first_frame_id': zone_event_msgs[0].frame_id,
+                    'last_frame_id': zone_event_msgs[-1].frame_id,
+                    'batch_size': len(zone_event_msgs)
+                }
+            )
+
+        return success
@@ -17,12 +17,14 @@ Types:
 - Timestamp: ISO 8601 timestamp wrapper
 """
 
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from .._isotime import format_utc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BBox:
     """
     Immutable bounding box representation.
@@ -50,6 +52,10 @@ class BBox:
     width: float
     height: float
 
+    # Required wire keys; from_dict() and check_dict() report every missing
+    # one (same convention for _REQUIRED on the other schema classes)
+    _REQUIRED = ('x', 'y', 'width', 'height')
+
     def __post_init__(self):
         """Validate invariants."""
         if self.width <= 0:
@@ -58,8 +64,30 @@ class BBox:
             raise ValueError(f"BBox height must be > 0, got {self.height}")
 
     def to_dict(self) -> Dict[str, float]:
-        """Serialize to JSON-compatible dict."""
-        return asdict(self)
+        """Serialize to JSON-compatible dict (dict literal, not asdict())."""
+        return {
+            'x': self.x,
+            'y': self.y,
+            'width': self.width,
+            'height': self.height
+        }
+
+    @classmethod
+    def unchecked(cls, x: float, y: float, width: float, height: float) -> 'BBox':
+        """Create a BBox without running the invariant checks.
+
+        For producers that already guarantee width/height > 0 (e.g. boxes
+        filtered upstream). Never use it for data decoded off the wire:
+        from_dict() and the constructor validate.
+        """
+        self = object.__new__(cls)
+        # Slot descriptors directly: skips __init__, __post_init__ and the
+        # frozen __setattr__ guard
+        _set_x(self, x)
+        _set_y(self, y)
+        _set_width(self, width)
+        _set_height(self, height)
+        return self
 
     @classmethod
     def from_dict(cls, data: Dict[str, float]) -> 'BBox':
@@ -75,17 +103,44 @@ class BBox:
             ValueError: If required keys missing or invalid values
         """
         try:
+            # Positional: cheaper than keyword binding on the decode path
             return cls(
-                x=float(data['x']),
-                y=float(data['y']),
-                width=float(data['width']),
-                height=float(data['height'])
+                float(data['x']),
+                float(data['y']),
+                float(data['width']),
+                float(data['height'])
             )
         except KeyError as e:
-            raise ValueError(f"Missing required BBox field: {e}")
+            # Error path only: report every missing key, not just the first
+            missing = [key for key in cls._REQUIRED if key not in data]
+            raise ValueError(
+                f"Missing required BBox field(s): {', '.join(missing) or e}"
+            )
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid BBox data: {e}")
 
+    @classmethod
+    def check_dict(cls, data: Any) -> Optional[str]:
+        """Check a wire dict without raising (see DetectionMessage.try_from_dict).
+
+        Returns:
+            None if data passes (from_dict() then accepts it), else the
+            error message
+        """
+        if not isinstance(data, dict):
+            return f"Invalid BBox data: expected an object, got {type(data).__name__}"
+        missing = [key for key in cls._REQUIRED if key not in data]
+        if missing:
+            return f"Missing required BBox field(s): {', '.join(missing)}"
+        for key in cls._REQUIRED:
+            if not isinstance(data[key], (int, float)):
+                return f"Invalid BBox data: {key} must be a number, got {data[key]!r}"
+        if data['width'] <= 0:
+            return f"Invalid BBox data: BBox width must be > 0, got {data['width']}"
+        if data['height'] <= 0:
+            return f"Invalid BBox data: BBox height must be > 0, got {data['height']}"
+        return None
+
     @property
     def center_x(self) -> float:
         """Center x-coordinate."""
@@ -102,7 +157,13 @@ class BBox:
         return self.width * self.height
 
 
-@dataclass(frozen=True)
+_set_x = BBox.x.__set__
+_set_y = BBox.y.__set__
+_set_width = BBox.width.__set__
+_set_height = BBox.height.__set__
+
+
+@dataclass(frozen=True, slots=True)
 class Timestamp:
     """
     Immutable ISO 8601 timestamp wrapper.
@@ -121,8 +182,18 @@ class Timestamp:
 
     @classmethod
     def now(cls) -> 'Timestamp':
-        """Create timestamp from current time."""
-        return cls(value=datetime.utcnow().isoformat())
+        """Create timestamp from current time (UTC)."""
+        return cls.from_time_ns(time.time_ns())
+
+    @classmethod
+    def from_time_ns(cls, ns: int) -> 'Timestamp':
+        """Create timestamp from epoch nanoseconds (e.g. time.time_ns()).
+
+        Same naive UTC format as before ('YYYY-MM-DDTHH:MM:SS.ffffff'),
+        split with integer math. Messages of the same frame can share one
+        call's result.
+        """
+        return cls(format_utc(*divmod(ns // 1000, 1_000_000)))
 
     @classmethod
     def from_datetime(cls, dt: datetime) -> 'Timestamp':
@@ -16,12 +16,16 @@ Message Flow:
     YOLO Inference → Detection → DetectionPublisher → MQTT → Subscriber → Visualizer
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any
+import sys
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from .common import BBox, Timestamp
 
+if TYPE_CHECKING:
+    import numpy as np
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Detection:
     """
     Single object detection with tracking information.
@@ -51,6 +55,8 @@ class Detection:
     confidence: float
     bbox: BBox
 
+    _REQUIRED = ('tracker_id', 'class', 'confidence', 'bbox')
+
     def __post_init__(self):
         """Validate invariants."""
         if not (0.0 <= self.confidence <= 1.0):
@@ -71,6 +77,28 @@ class Detection:
             'bbox': self.bbox.to_dict()
         }
 
+    @classmethod
+    def unchecked(
+        cls,
+        tracker_id: int,
+        class_name: str,
+        confidence: float,
+        bbox: BBox
+    ) -> 'Detection':
+        """Create a Detection without running the invariant checks.
+
+        For producers that already guarantee the invariants (tracker IDs
+        from ByteTrack, model confidences). Pair with BBox.unchecked().
+        Decoded data must go through from_dict() / the constructor.
+        """
+        self = object.__new__(cls)
+        # Slot descriptors directly (see BBox.unchecked)
+        _set_tracker_id(self, tracker_id)
+        _set_class_name(self, class_name)
+        _set_confidence(self, confidence)
+        _set_bbox(self, bbox)
+        return self
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Detection':
         """Deserialize from dict.
@@ -85,19 +113,58 @@ class Detection:
             ValueError: If required fields missing or invalid
         """
         try:
+            # Positional: cheaper than keyword binding on the decode path.
+            # class_name is interned: decoded strings are fresh objects, and
+            # the vocabulary is small, so compares/dict lookups become
+            # identity checks
             return cls(
-                tracker_id=int(data['tracker_id']),
-                class_name=str(data['class']),
-                confidence=float(data['confidence']),
-                bbox=BBox.from_dict(data['bbox'])
+                int(data['tracker_id']),
+                sys.intern(str(data['class'])),
+                float(data['confidence']),
+                BBox.from_dict(data['bbox'])
             )
         except KeyError as e:
-            raise ValueError(f"Missing required Detection field: {e}")
+            missing = [key for key in cls._REQUIRED if key not in data]
+            raise ValueError(
+                f"Missing required Detection field(s): {', '.join(missing) or e}"
+            )
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid Detection data: {e}")
 
+    @classmethod
+    def check_dict(cls, data: Any) -> Optional[str]:
+        """Check a wire dict without raising (see DetectionMessage.try_from_dict).
 
-@dataclass(frozen=True)
+        Returns:
+            None if data passes (from_dict() then accepts it), else the
+            error message
+        """
+        if not isinstance(data, dict):
+            return f"Invalid Detection data: expected an object, got {type(data).__name__}"
+        missing = [key for key in cls._REQUIRED if key not in data]
+        if missing:
+            return f"Missing required Detection field(s): {', '.join(missing)}"
+        tracker_id = data['tracker_id']
+        if not isinstance(tracker_id, int) or tracker_id < 0:
+            return f"Invalid Detection data: tracker_id must be an int >= 0, got {tracker_id!r}"
+        if not isinstance(data['class'], str):
+            return f"Invalid Detection data: class must be a string, got {data['class']!r}"
+        confidence = data['confidence']
+        if not isinstance(confidence, (int, float)) or not (0.0 <= confidence <= 1.0):
+            return f"Invalid Detection data: confidence must be in [0.0, 1.0], got {confidence!r}"
+        error = BBox.check_dict(data['bbox'])
+        if error is not None:
+            return f"Invalid Detection data: {error}"
+        return None
+
+
+_set_tracker_id = Detection.tracker_id.__set__
+_set_class_name = Detection.class_name.__set__
+_set_confidence = Detection.confidence.__set__
+_set_bbox = Detection.bbox.__set__
+
+
+@dataclass(frozen=True, slots=True)
 class DetectionMessage:
     """
     Complete detection message for MQTT publication.
@@ -109,7 +176,7 @@ class DetectionMessage:
         timestamp: ISO 8601 timestamp of message creation
         frame_id: Sequential frame number
         source_id: Video source identifier (for multi-camera)
-        detections: List of detected objects
+        detections: Tuple of detected objects (lists are converted)
 
     Example:
         >>> msg = DetectionMessage(
@@ -125,7 +192,14 @@ class DetectionMessage:
     timestamp: Timestamp
     frame_id: int
     source_id: int
-    detections: List[Detection] = field(default_factory=list)
+    detections: Tuple[Detection, ...] = field(default_factory=tuple)
+    # class_name -> detections, built on first get_detections_by_class()
+    # (not part of the message: excluded from init/repr/eq)
+    _class_index: Optional[Dict[str, Tuple[Detection, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    _REQUIRED = ('schema_version', 'timestamp', 'frame_id', 'source_id')
 
     def __post_init__(self):
         """Validate invariants."""
@@ -133,6 +207,9 @@ class DetectionMessage:
             raise ValueError(f"Frame ID must be >= 0, got {self.frame_id}")
         if self.source_id < 0:
             raise ValueError(f"Source ID must be >= 0, got {self.source_id}")
+        # Immutable like the rest of the message (callers may pass a list)
+        if type(self.detections) is not tuple:
+            object.__setattr__(self, 'detections', tuple(self.detections))
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to JSON-compatible dict.
@@ -161,22 +238,83 @@ class DetectionMessage:
         Raises:
             ValueError: If required fields missing or invalid
         """
+        detection_from_dict = Detection.from_dict
         try:
             return cls(
                 schema_version=str(data['schema_version']),
                 timestamp=Timestamp(value=data['timestamp']),
                 frame_id=int(data['frame_id']),
                 source_id=int(data['source_id']),
-                detections=[
-                    Detection.from_dict(det)
-                    for det in data.get('detections', [])
-                ]
+                # List comprehension + tuple(): faster than a generator
+                detections=tuple([
+                    detection_from_dict(det)
+                    for det in data.get('detections', ())
+                ])
             )
         except KeyError as e:
-            raise ValueError(f"Missing required DetectionMessage field: {e}")
+            missing = [key for key in cls._REQUIRED if key not in data]
+            raise ValueError(
+                f"Missing required DetectionMessage field(s): {', '.join(missing) or e}"
+            )
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid DetectionMessage data: {e}")
 
+    @classmethod
+    def check_dict(cls, data: Any) -> Optional[str]:
+        """Check a wire dict without raising.
+
+        Explicit key/type/invariant checks, nested detections included.
+        Stricter than from_dict(): numeric fields must be JSON numbers and
+        integer fields JSON integers, where from_dict() also converts
+        numeric strings and whole-number floats.
+
+        Returns:
+            None if data passes (from_dict() then accepts it), else the
+            error message
+        """
+        if not isinstance(data, dict):
+            return f"Invalid DetectionMessage data: expected an object, got {type(data).__name__}"
+        missing = [key for key in cls._REQUIRED if key not in data]
+        if missing:
+            return f"Missing required DetectionMessage field(s): {', '.join(missing)}"
+        if not isinstance(data['timestamp'], str):
+            return f"Invalid DetectionMessage data: timestamp must be a string, got {data['timestamp']!r}"
+        for key in ('frame_id', 'source_id'):
+            if not isinstance(data[key], int) or data[key] < 0:
+                return f"Invalid DetectionMessage data: {key} must be an int >= 0, got {data[key]!r}"
+        detections = data.get('detections', ())
+        if not isinstance(detections, (list, tuple)):
+            return f"Invalid DetectionMessage data: detections must be a list, got {type(detections).__name__}"
+        check_detection = Detection.check_dict
+        for det in detections:
+            error = check_detection(det)
+            if error is not None:
+                return f"Invalid DetectionMessage data: {error}"
+        return None
+
+    @classmethod
+    def try_from_dict(
+        cls, data: Dict[str, Any]
+    ) -> Tuple[Optional['DetectionMessage'], Optional[str]]:
+        """Deserialize from dict, reporting invalid input as a value.
+
+        For consumers that treat malformed input as a routine branch
+        (e.g. a subscriber logging bad frames): data is checked up front
+        with check_dict(), so a bad frame is rejected without raising.
+        Stricter than from_dict(): payloads it only accepts by converting
+        (e.g. frame_id "3", tracker_id 2.0) are rejected here.
+
+        Args:
+            data: Dictionary with message fields
+
+        Returns:
+            (DetectionMessage instance, None) or (None, error message)
+        """
+        error = cls.check_dict(data)
+        if error is not None:
+            return None, error
+        return cls.from_dict(data), None
+
     @property
     def detection_count(self) -> int:
         """Number of detections in this message."""
@@ -190,8 +328,18 @@ class DetectionMessage:
 
         Returns:
             List of detections matching class
+
+        The first call groups all detections by class (O(N)); later
+        lookups on the same message are O(1).
         """
-        return [det for det in self.detections if det.class_name == class_name]
+        index = self._class_index
+        if index is None:
+            groups: Dict[str, List[Detection]] = {}
+            for det in self.detections:
+                groups.setdefault(det.class_name, []).append(det)
+            index = {name: tuple(dets) for name, dets in groups.items()}
+            object.__setattr__(self, '_class_index', index)
+        return list(index.get(class_name, ()))
 
     def get_tracker_ids(self) -> List[int]:
         """Extract all tracker IDs from detections.
@@ -200,3 +348,29 @@ class DetectionMessage:
             List of tracker IDs (may contain duplicates if tracking failed)
         """
         return [det.tracker_id for det in self.detections]
+
+    def bboxes_as_array(self) -> 'np.ndarray':
+        """Bounding boxes as an (N, 4) float32 array of x, y, width, height.
+
+        For bulk geometry on the subscriber side (centers, areas, zone
+        tests) as NumPy ops instead of per-BBox property calls.
+
+        Returns:
+            Array of shape (N, 4); (0, 4) if there are no detections
+
+        Example:
+            >>> boxes = msg.bboxes_as_array()
+            >>> centers = boxes[:, :2] + boxes[:, 2:] / 2
+            >>> areas = boxes[:, 2] * boxes[:, 3]
+        """
+        import numpy as np  # only needed by callers doing array math
+
+        return np.fromiter(
+            (
+                value
+                for det in self.detections
+                for value in (det.bbox.x, det.bbox.y, det.bbox.width, det.bbox.height)
+            ),
+            dtype=np.float32,
+            count=len(self.detections) * 4
+        ).reshape(-1, 4)
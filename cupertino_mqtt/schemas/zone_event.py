@@ -15,8 +15,9 @@ Message Flow:
     ZoneMonitor → ZoneEvent → ZoneEventPublisher → MQTT → Subscriber → Visualizer
 """
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from .common import Timestamp
 
@@ -39,7 +40,35 @@ class CrossingDirection(str, Enum):
     OUT = "out"
 
 
-@dataclass(frozen=True)
+# Enum member -> value string, resolved once at import (plain dict lookup
+# instead of the Enum `.value` descriptor in to_dict on the per-frame path)
+_ENUM_STR = {
+    member: member.value
+    for enum_cls in (ZoneType, EventType, CrossingDirection)
+    for member in enum_cls
+}
+
+# Wire value -> Enum member for from_dict (dict lookup instead of the Enum
+# constructor's metaclass call). str-valued members hash like their value,
+# so members are accepted as keys too
+_ZONE_TYPE_LOOKUP = {member.value: member for member in ZoneType}
+_EVENT_TYPE_LOOKUP = {member.value: member for member in EventType}
+_CROSSING_DIR_LOOKUP = {member.value: member for member in CrossingDirection}
+
+
+def _lookup_enum(table: Dict[Any, Enum], value: Any, enum_cls: type) -> Any:
+    """Resolve a wire value via its lookup table (ValueError if unknown,
+    like the Enum constructor)."""
+    try:
+        member = table.get(value)
+    except TypeError:  # unhashable value
+        member = None
+    if member is None:
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}")
+    return member
+
+
+@dataclass(frozen=True, slots=True)
 class ZoneStats:
     """
     Immutable zone statistics snapshot.
@@ -72,8 +101,12 @@ class ZoneStats:
     current_count: Optional[int] = None
 
     def to_dict(self) -> Dict[str, Optional[int]]:
-        """Serialize to JSON-compatible dict."""
-        return asdict(self)
+        """Serialize to JSON-compatible dict (dict literal, not asdict())."""
+        return {
+            'total_in': self.total_in,
+            'total_out': self.total_out,
+            'current_count': self.current_count
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Optional[int]]) -> 'ZoneStats':
@@ -85,7 +118,7 @@ class ZoneStats:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZoneEvent:
     """
     Single zone event (one zone's state).
@@ -98,12 +131,13 @@ class ZoneEvent:
         zone_type: Type of zone (polygon or line)
         event_type: Type of event (inside or crossing)
         stats: Statistical snapshot
-        triggered_by: List of tracker IDs that triggered this event
+        triggered_by: Tuple of tracker IDs that triggered this event
+            (lists are converted)
         crossing_direction: Direction for line crossings (None for polygons)
 
     Invariants:
         - If zone_type == LINE, crossing_direction must be set
-        - triggered_by is empty list if no objects involved
+        - triggered_by is an empty tuple if no objects involved
 
     Example (Polygon):
         >>> event = ZoneEvent(
@@ -128,27 +162,31 @@ class ZoneEvent:
     zone_type: ZoneType
     event_type: EventType
     stats: ZoneStats
-    triggered_by: List[int] = field(default_factory=list)
+    triggered_by: Tuple[int, ...] = field(default_factory=tuple)
     crossing_direction: Optional[CrossingDirection] = None
 
+    _REQUIRED = ('zone_id', 'zone_type', 'event_type', 'stats')
+
     def __post_init__(self):
         """Validate invariants."""
         if self.zone_type == ZoneType.LINE and self.crossing_direction is None:
             raise ValueError(
                 "Line zones must have crossing_direction set"
             )
+        if type(self.triggered_by) is not tuple:
+            object.__setattr__(self, 'triggered_by', tuple(self.triggered_by))
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to JSON-compatible dict."""
         result = {
             'zone_id': self.zone_id,
-            'zone_type': self.zone_type.value,
-            'event_type': self.event_type.value,
+            'zone_type': _ENUM_STR[self.zone_type],
+            'event_type': _ENUM_STR[self.event_type],
             'stats': self.stats.to_dict(),
             'triggered_by': self.triggered_by
         }
         if self.crossing_direction is not None:
-            result['crossing_direction'] = self.crossing_direction.value
+            result['crossing_direction'] = _ENUM_STR[self.crossing_direction]
         return result
 
     @classmethod
@@ -167,28 +205,61 @@ class ZoneEvent:
         try:
             crossing_dir = None
             if 'crossing_direction' in data:
-                crossing_dir = CrossingDirection(data['crossing_direction'])
+                crossing_dir = _lookup_enum(
+                    _CROSSING_DIR_LOOKUP, data['crossing_direction'], CrossingDirection
+                )
 
             return cls(
-                zone_id=str(data['zone_id']),
-                zone_type=ZoneType(data['zone_type']),
-                event_type=EventType(data['event_type']),
+                zone_id=sys.intern(str(data['zone_id'])),  # small vocabulary
+                zone_type=_lookup_enum(_ZONE_TYPE_LOOKUP, data['zone_type'], ZoneType),
+                event_type=_lookup_enum(_EVENT_TYPE_LOOKUP, data['event_type'], EventType),
                 stats=ZoneStats.from_dict(data['stats']),
-                triggered_by=list(data.get('triggered_by', [])),
+                triggered_by=tuple(data.get('triggered_by', ())),
                 crossing_direction=crossing_dir
             )
         except KeyError as e:
-            raise ValueError(f"Missing required ZoneEvent field: {e}")
+            missing = [key for key in cls._REQUIRED if key not in data]
+            raise ValueError(
+                f"Missing required ZoneEvent field(s): {', '.join(missing) or e}"
+            )
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid ZoneEvent data: {e}")
 
+    @classmethod
+    def check_dict(cls, data: Any) -> Optional[str]:
+        """Check a wire dict without raising (see ZoneEventMessage.try_from_dict).
+
+        Returns:
+            None if data passes (from_dict() then accepts it), else the
+            error message
+        """
+        if not isinstance(data, dict):
+            return f"Invalid ZoneEvent data: expected an object, got {type(data).__name__}"
+        missing = [key for key in cls._REQUIRED if key not in data]
+        if missing:
+            return f"Missing required ZoneEvent field(s): {', '.join(missing)}"
+        for key, table, enum_cls in (
+            ('zone_type', _ZONE_TYPE_LOOKUP, ZoneType),
+            ('event_type', _EVENT_TYPE_LOOKUP, EventType),
+            ('crossing_direction', _CROSSING_DIR_LOOKUP, CrossingDirection),
+        ):
+            if key in data and not (isinstance(data[key], str) and data[key] in table):
+                return f"Invalid ZoneEvent data: {data[key]!r} is not a valid {enum_cls.__name__}"
+        if not isinstance(data['stats'], dict):
+            return f"Invalid ZoneEvent data: stats must be an object, got {data['stats']!r}"
+        if not isinstance(data.get('triggered_by', ()), (list, tuple)):
+            return f"Invalid ZoneEvent data: triggered_by must be a list, got {data['triggered_by']!r}"
+        if data['zone_type'] == ZoneType.LINE and 'crossing_direction' not in data:
+            return "Invalid ZoneEvent data: Line zones must have crossing_direction set"
+        return None
+
     @property
     def object_count(self) -> int:
         """Number of objects involved in this event."""
         return len(self.triggered_by)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZoneEventMessage:
     """
     Complete zone event message for MQTT publication.
@@ -200,7 +271,7 @@ class ZoneEventMessage:
         timestamp: ISO 8601 timestamp of message creation
         frame_id: Sequential frame number (correlates with DetectionMessage)
         source_id: Video source identifier
-        zones: List of zone events (one per monitored zone)
+        zones: Tuple of zone events, one per monitored zone (lists are converted)
 
     Example:
         >>> msg = ZoneEventMessage(
@@ -215,7 +286,14 @@ class ZoneEventMessage:
     timestamp: Timestamp
     frame_id: int
     source_id: int
-    zones: List[ZoneEvent] = field(default_factory=list)
+    zones: Tuple[ZoneEvent, ...] = field(default_factory=tuple)
+    # zone_id -> ZoneEvent, built on first get_zone_by_id() (not part of
+    # the message: excluded from init/repr/eq)
+    _zone_index: Optional[Dict[str, 'ZoneEvent']] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    _REQUIRED = ('schema_version', 'timestamp', 'frame_id', 'source_id')
 
     def __post_init__(self):
         """Validate invariants."""
@@ -223,6 +301,8 @@ class ZoneEventMessage:
             raise ValueError(f"Frame ID must be >= 0, got {self.frame_id}")
         if self.source_id < 0:
             raise ValueError(f"Source ID must be >= 0, got {self.source_id}")
+        if type(self.zones) is not tuple:
+            object.__setattr__(self, 'zones', tuple(self.zones))
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to JSON-compatible dict."""
@@ -247,22 +327,82 @@ class ZoneEventMessage:
         Raises:
             ValueError: If required fields missing or invalid
         """
+        zone_from_dict = ZoneEvent.from_dict
         try:
             return cls(
                 schema_version=str(data['schema_version']),
                 timestamp=Timestamp(value=data['timestamp']),
                 frame_id=int(data['frame_id']),
                 source_id=int(data['source_id']),
-                zones=[
-                    ZoneEvent.from_dict(zone)
-                    for zone in data.get('zones', [])
-                ]
+                zones=tuple([
+                    zone_from_dict(zone)
+                    for zone in data.get('zones', ())
+                ])
             )
         except KeyError as e:
-            raise ValueError(f"Missing required ZoneEventMessage field: {e}")
+            missing = [key for key in cls._REQUIRED if key not in data]
+            raise ValueError(
+                f"Missing required ZoneEventMessage field(s): {', '.join(missing) or e}"
+            )
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid ZoneEventMessage data: {e}")
 
+    @classmethod
+    def check_dict(cls, data: Any) -> Optional[str]:
+        """Check a wire dict without raising.
+
+        Explicit key/type/invariant checks, nested zone events included.
+        Stricter than from_dict(): numeric fields must be JSON numbers and
+        integer fields JSON integers, where from_dict() also converts
+        numeric strings and whole-number floats.
+
+        Returns:
+            None if data passes (from_dict() then accepts it), else the
+            error message
+        """
+        if not isinstance(data, dict):
+            return f"Invalid ZoneEventMessage data: expected an object, got {type(data).__name__}"
+        missing = [key for key in cls._REQUIRED if key not in data]
+        if missing:
+            return f"Missing required ZoneEventMessage field(s): {', '.join(missing)}"
+        if not isinstance(data['timestamp'], str):
+            return f"Invalid ZoneEventMessage data: timestamp must be a string, got {data['timestamp']!r}"
+        for key in ('frame_id', 'source_id'):
+            if not isinstance(data[key], int) or data[key] < 0:
+                return f"Invalid ZoneEventMessage data: {key} must be an int >= 0, got {data[key]!r}"
+        zones = data.get('zones', ())
+        if not isinstance(zones, (list, tuple)):
+            return f"Invalid ZoneEventMessage data: zones must be a list, got {type(zones).__name__}"
+        check_zone = ZoneEvent.check_dict
+        for zone in zones:
+            error = check_zone(zone)
+            if error is not None:
+                return f"Invalid ZoneEventMessage data: {error}"
+        return None
+
+    @classmethod
+    def try_from_dict(
+        cls, data: Dict[str, Any]
+    ) -> Tuple[Optional['ZoneEventMessage'], Optional[str]]:
+        """Deserialize from dict, reporting invalid input as a value.
+
+        For consumers that treat malformed input as a routine branch
+        (e.g. a subscriber logging bad frames): data is checked up front
+        with check_dict(), so a bad frame is rejected without raising.
+        Stricter than from_dict(): payloads it only accepts by converting
+        (e.g. frame_id "3" or 3.0) are rejected here.
+
+        Args:
+            data: Dictionary with message fields
+
+        Returns:
+            (ZoneEventMessage instance, None) or (None, error message)
+        """
+        error = cls.check_dict(data)
+        if error is not None:
+            return None, error
+        return cls.from_dict(data), None
+
     @property
     def zone_count(self) -> int:
         """Number of zones in this message."""
@@ -275,12 +415,17 @@ class ZoneEventMessage:
             zone_id: Zone identifier to search
 
         Returns:
-            ZoneEvent if found, None otherwise
+            ZoneEvent if found, None otherwise (first match if ids repeat)
+
+        The first call builds a zone_id index (O(N)); later lookups on the
+        same message are O(1).
         """
-        for zone in self.zones:
-            if zone.zone_id == zone_id:
-                return zone
-        return None
+        index = self._zone_index
+        if index is None:
+            # Reversed so the first zone wins on duplicate ids
+            index = {zone.zone_id: zone for zone in reversed(self.zones)}
+            object.__setattr__(self, '_zone_index', index)
+        return index.get(zone_id)
 
     def get_zones_by_type(self, zone_type: ZoneType) -> List[ZoneEvent]:
         """Filter zones by type.
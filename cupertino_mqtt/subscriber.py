@@ -54,13 +54,28 @@ Example (Visualizer):
 """
 
 import json
+import logging
 import threading
-from typing import Optional, Callable
+from collections import deque
+from typing import Any, Callable, List, Optional
 import paho.mqtt.client as mqtt
 
+# orjson is optional: C parser, several times faster than json.loads and
+# parses the payload bytes directly (no intermediate str).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers match.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads  # also accepts UTF-8 bytes
+
 from .schemas import DetectionMessage, ZoneEventMessage
 from .logging import StructuredLogger, LogEvent
 
+# Message kinds: index into the subscriber's (detection, zone event)
+# callback tuples
+_DETECTION = 0
+_ZONE_EVENT = 1
+
 
 class MessageSubscriber:
     """
@@ -95,6 +110,18 @@ class MessageSubscriber:
         >>> subscriber.start()
     """
 
+    # Fixed attribute set: no per-instance __dict__ (subclasses that don't
+    # declare __slots__ still get one for their own attributes)
+    __slots__ = (
+        'broker_host', 'broker_port', 'detection_topic', 'zone_event_topic',
+        'client_id', 'logger', 'qos', 'share_group', '_log_receive_sample',
+        'on_detection', 'on_zone_event', 'on_detection_batch',
+        'on_zone_event_batch', 'client', '_connected', '_running',
+        '_detection_count', '_zone_event_count', 'dispatch_queue_size',
+        '_dispatch_queue', '_dispatch_cond', '_dispatch_running',
+        '_dispatch_thread', '_dropped_count',
+    )
+
     def __init__(
         self,
         broker_host: str,
@@ -107,7 +134,12 @@ class MessageSubscriber:
         client_id: str = "cupertino_subscriber",
         username: Optional[str] = None,
         password: Optional[str] = None,
-        qos: int = 0
+        qos: int = 0,
+        log_receive_sample: int = 100,
+        dispatch_queue_size: int = 0,
+        on_detection_batch: Optional[Callable[[List[DetectionMessage]], None]] = None,
+        on_zone_event_batch: Optional[Callable[[List[ZoneEventMessage]], None]] = None,
+        share_group: Optional[str] = None
     ):
         """
         Initialize MQTT subscriber.
@@ -124,10 +156,29 @@ class MessageSubscriber:
             username: MQTT auth username (optional)
             password: MQTT auth password (optional)
             qos: Quality of Service (default: 0)
+            log_receive_sample: Log every Nth received message per topic
+                (default: 100; 1 = every message, 0 = never)
+            dispatch_queue_size: Run callbacks on a worker thread fed by a
+                queue of this size, dropping the oldest message when full
+                (default: 0, callbacks run inline in the MQTT thread)
+            on_detection_batch: Called once with the detection messages
+                queued since the last dispatch, instead of on_detection per
+                message (optional; requires dispatch_queue_size)
+            on_zone_event_batch: Same, for zone event messages (optional;
+                requires dispatch_queue_size)
+            share_group: Subscribe through the broker's shared subscription
+                group $share/<share_group>/<topic>, so several subscribers
+                split the messages between them (optional; broker support
+                required)
+
+        Raises:
+            ValueError: If a batch callback is given without
+                dispatch_queue_size
 
         Design Note:
-            Callbacks are invoked in MQTT thread. Keep them fast or dispatch
-            to worker threads if processing is heavy.
+            By default callbacks are invoked in the MQTT thread: a slow
+            callback delays reception. Keep them fast, or set
+            dispatch_queue_size so the MQTT loop only decodes and enqueues.
         """
         self.broker_host = broker_host
         self.broker_port = broker_port
@@ -136,10 +187,17 @@ class MessageSubscriber:
         self.client_id = client_id
         self.logger = logger
         self.qos = qos
+        self.share_group = share_group
+        self._log_receive_sample = log_receive_sample
+
+        if (on_detection_batch or on_zone_event_batch) and not dispatch_queue_size:
+            raise ValueError("Batch callbacks require dispatch_queue_size > 0")
 
         # User callbacks
         self.on_detection = on_detection
         self.on_zone_event = on_zone_event
+        self.on_detection_batch = on_detection_batch
+        self.on_zone_event_batch = on_zone_event_batch
 
         # MQTT client setup
         self.client = mqtt.Client(client_id=client_id)
@@ -149,13 +207,29 @@ class MessageSubscriber:
         # Callbacks
         self.client.on_connect = self._on_connect
         self.client.on_disconnect = self._on_disconnect
+        # Routing: paho dispatches each topic straight to its callback (no
+        # per-message topic compares here; wildcard filters work too).
+        # on_message only sees topics neither callback matches
+        self.client.message_callback_add(detection_topic, self._on_detection)
+        self.client.message_callback_add(zone_event_topic, self._on_zone_event)
         self.client.on_message = self._on_message
 
         # State
         self._connected = threading.Event()
         self._running = False
-        self._stats_lock = threading.Lock()
-        self._message_count = {'detections': 0, 'zone_events': 0}
+        # Message counters: written only by the MQTT network thread (single
+        # writer, no lock); get_stats() readers see a whole int either way
+        self._detection_count = 0
+        self._zone_event_count = 0
+
+        # Callback dispatch (dispatch_queue_size > 0): bounded queue of
+        # (kind, message); deque(maxlen) drops the oldest when full
+        self.dispatch_queue_size = dispatch_queue_size
+        self._dispatch_queue: deque = deque(maxlen=dispatch_queue_size or None)
+        self._dispatch_cond = threading.Condition()
+        self._dispatch_running = False
+        self._dispatch_thread: Optional[threading.Thread] = None
+        self._dropped_count = 0
 
     def _on_connect(
         self,
@@ -178,9 +252,13 @@ class MessageSubscriber:
         if rc == 0:
             self._connected.set()
 
-            # Subscribe to both topics
-            client.subscribe(self.detection_topic, qos=self.qos)
-            client.subscribe(self.zone_event_topic, qos=self.qos)
+            # Subscribe to both topics in one SUBSCRIBE packet (one SUBACK).
+            # Shared filters only change what is subscribed: messages still
+            # arrive on the plain topic, so the topic callbacks match as-is
+            client.subscribe([
+                (self._subscription_filter(self.detection_topic), self.qos),
+                (self._subscription_filter(self.zone_event_topic), self.qos)
+            ])
 
             self.logger.info(
                 event=LogEvent.MQTT_CONNECTED,
@@ -188,7 +266,8 @@ class MessageSubscriber:
                 metadata={
                     'broker': f"{self.broker_host}:{self.broker_port}",
                     'detection_topic': self.detection_topic,
-                    'zone_event_topic': self.zone_event_topic
+                    'zone_event_topic': self.zone_event_topic,
+                    'share_group': self.share_group
                 }
             )
         else:
@@ -198,6 +277,12 @@ class MessageSubscriber:
                 metadata={'broker': f"{self.broker_host}:{self.broker_port}"}
             )
 
+    def _subscription_filter(self, topic: str) -> str:
+        """Topic filter to subscribe with ($share/<group>/<topic> if shared)."""
+        if self.share_group:
+            return f"$share/{self.share_group}/{topic}"
+        return topic
+
     def _on_disconnect(
         self,
         client: mqtt.Client,
@@ -222,6 +307,24 @@ class MessageSubscriber:
             }
         )
 
+    def _on_detection(
+        self,
+        client: mqtt.Client,
+        userdata: any,
+        msg: mqtt.MQTTMessage
+    ) -> None:
+        """Callback for messages on detection_topic (routed by paho)."""
+        self._decode_payload(msg, self._handle_detection_message)
+
+    def _on_zone_event(
+        self,
+        client: mqtt.Client,
+        userdata: any,
+        msg: mqtt.MQTTMessage
+    ) -> None:
+        """Callback for messages on zone_event_topic (routed by paho)."""
+        self._decode_payload(msg, self._handle_zone_event_message)
+
     def _on_message(
         self,
         client: mqtt.Client,
@@ -229,32 +332,45 @@ class MessageSubscriber:
         msg: mqtt.MQTTMessage
     ) -> None:
         """
-        Callback when message received.
-
-        Deserializes JSON and invokes appropriate user callback.
+        Callback for messages matching neither topic callback.
 
         Args:
             client: MQTT client instance
             userdata: User data (unused)
             msg: MQTT message with topic and payload
         """
+        self.logger.warning(
+            event=LogEvent.DESERIALIZATION_ERROR,
+            message=f"Received message from unknown topic: {msg.topic}"
+        )
+
+    def _decode_payload(
+        self,
+        msg: mqtt.MQTTMessage,
+        handler: Callable[[dict], None]
+    ) -> None:
+        """
+        Deserialize JSON and pass each message to the topic's handler.
+
+        Args:
+            msg: MQTT message with topic and payload
+            handler: _handle_detection_message or _handle_zone_event_message
+        """
         try:
-            # Decode JSON
-            payload = msg.payload.decode('utf-8')
-            data = json.loads(payload)
-
-            # Route by topic
-            if msg.topic == self.detection_topic:
-                self._handle_detection_message(data)
-            elif msg.topic == self.zone_event_topic:
-                self._handle_zone_event_message(data)
+            # Decode JSON straight from the payload bytes
+            data = _json_loads(msg.payload)
+
+            # Batched publishers send a JSON array of messages; a single
+            # message is handled directly (no wrapper tuple per message)
+            if type(data) is list:
+                for message in data:
+                    handler(message)
             else:
-                self.logger.warning(
-                    event=LogEvent.DESERIALIZATION_ERROR,
-                    message=f"Received message from unknown topic: {msg.topic}"
-                )
+                handler(data)
 
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            # Invalid UTF-8 is a decode error too: orjson reports it as
+            # JSONDecodeError, json.loads(bytes) as UnicodeDecodeError
             self.logger.error(
                 event=LogEvent.DESERIALIZATION_ERROR,
                 message="Failed to decode JSON message",
@@ -279,34 +395,35 @@ class MessageSubscriber:
             data: JSON data dictionary
         """
         try:
-            # Deserialize
-            detection_msg = DetectionMessage.from_dict(data)
+            # Deserialize: malformed input is a routine branch, not an
+            # exception (bad frames are logged without a traceback)
+            detection_msg, error = DetectionMessage.try_from_dict(data)
+            if error is not None:
+                self.logger.error(
+                    event=LogEvent.SCHEMA_VALIDATION_ERROR,
+                    message="Detection message failed schema validation",
+                    metadata={'error': error, 'data': data}
+                )
+                return
 
             # Update stats
-            with self._stats_lock:
-                self._message_count['detections'] += 1
-
-            # Log
-            self.logger.info(
-                event=LogEvent.DETECTION_RECEIVED,
-                message=f"Received detection message",
-                metadata={
-                    'frame_id': detection_msg.frame_id,
-                    'detection_count': detection_msg.detection_count,
-                    'source_id': detection_msg.source_id
-                }
-            )
+            self._detection_count += 1
+
+            # Sampled log (metadata only built when one is due)
+            if self._receive_log_due(self._detection_count):
+                self.logger.info(
+                    event=LogEvent.DETECTION_RECEIVED,
+                    message="Received detection message",
+                    metadata={
+                        'frame_id': detection_msg.frame_id,
+                        'detection_count': detection_msg.detection_count,
+                        'source_id': detection_msg.source_id
+                    }
+                )
 
-            # Invoke user callback
-            self.on_detection(detection_msg)
+            # Invoke user callback (inline or via the dispatch queue)
+            self._deliver(_DETECTION, detection_msg)
 
-        except ValueError as e:
-            self.logger.error(
-                event=LogEvent.SCHEMA_VALIDATION_ERROR,
-                message="Detection message failed schema validation",
-                exc_info=e,
-                metadata={'data': data}
-            )
         except Exception as e:
             self.logger.error(
                 event=LogEvent.DESERIALIZATION_ERROR,
@@ -324,35 +441,39 @@ class MessageSubscriber:
             data: JSON data dictionary
         """
         try:
-            # Deserialize
-            zone_event_msg = ZoneEventMessage.from_dict(data)
+            # Deserialize: malformed input is a routine branch, not an
+            # exception (bad frames are logged without a traceback)
+            zone_event_msg, error = ZoneEventMessage.try_from_dict(data)
+            if error is not None:
+                self.logger.error(
+                    event=LogEvent.SCHEMA_VALIDATION_ERROR,
+                    message="Zone event message failed schema validation",
+                    metadata={'error': error, 'data': data}
+                )
+                return
 
             # Update stats
-            with self._stats_lock:
-                self._message_count['zone_events'] += 1
+            self._zone_event_count += 1
 
-            # Log
-            self.logger.info(
-                event=LogEvent.ZONE_EVENT_RECEIVED,
-                message=f"Received zone event message",
-                metadata={
+            # Sampled log (metadata only built when one is due)
+            if self._receive_log_due(self._zone_event_count):
+                metadata = {
                     'frame_id': zone_event_msg.frame_id,
                     'zone_count': zone_event_msg.zone_count,
-                    'source_id': zone_event_msg.source_id,
-                    'zone_ids': [z.zone_id for z in zone_event_msg.zones]
+                    'source_id': zone_event_msg.source_id
                 }
-            )
+                # Per-zone detail only at DEBUG (walks every zone)
+                if self.logger.is_enabled_for(logging.DEBUG):
+                    metadata['zone_ids'] = [z.zone_id for z in zone_event_msg.zones]
+                self.logger.info(
+                    event=LogEvent.ZONE_EVENT_RECEIVED,
+                    message="Received zone event message",
+                    metadata=metadata
+                )
 
-            # Invoke user callback
-            self.on_zone_event(zone_event_msg)
+            # Invoke user callback (inline or via the dispatch queue)
+            self._deliver(_ZONE_EVENT, zone_event_msg)
 
-        except ValueError as e:
-            self.logger.error(
-                event=LogEvent.SCHEMA_VALIDATION_ERROR,
-                message="Zone event message failed schema validation",
-                exc_info=e,
-                metadata={'data': data}
-            )
         except Exception as e:
             self.logger.error(
                 event=LogEvent.DESERIALIZATION_ERROR,
@@ -360,6 +481,118 @@ class MessageSubscriber:
                 exc_info=e
             )
 
+    def _deliver(self, kind: int, message: Any) -> None:
+        """
+        Hand a decoded message to its user callback.
+
+        Inline when dispatch is off; otherwise enqueue for the dispatch
+        thread (dropping the oldest queued message if the queue is full).
+        """
+        if not self.dispatch_queue_size:
+            if kind == _DETECTION:
+                self.on_detection(message)
+            else:
+                self.on_zone_event(message)
+            return
+
+        with self._dispatch_cond:
+            queue = self._dispatch_queue
+            if len(queue) == self.dispatch_queue_size:
+                self._dropped_count += 1
+            queue.append((kind, message))
+            self._dispatch_cond.notify()
+
+    # ===== Callback dispatch (worker thread) =====
+
+    def _start_dispatch_thread(self) -> None:
+        """Start the callback dispatch thread (no-op if already running)."""
+        if self._dispatch_thread is not None:
+            return
+        self._dispatch_running = True
+        self._dispatch_thread = threading.Thread(
+            target=self._dispatch_loop,
+            name=f"{self.client_id}-dispatch",
+            daemon=True
+        )
+        self._dispatch_thread.start()
+
+    def _stop_dispatch_thread(self) -> None:
+        """Stop the dispatch thread after it has delivered everything queued."""
+        if self._dispatch_thread is None:
+            return
+        with self._dispatch_cond:
+            self._dispatch_running = False
+            self._dispatch_cond.notify()
+        self._dispatch_thread.join()
+        self._dispatch_thread = None
+
+    def _dispatch_loop(self) -> None:
+        """
+        Dispatch thread: invoke user callbacks for queued messages.
+
+        Takes everything queued at each wake-up. Runs of same-kind
+        messages go to the batch callback in one call when one is set,
+        otherwise to the per-message callback; order is preserved. Exits
+        on stop once the queue is drained. A failing callback is logged
+        and does not stop the loop.
+        """
+        queue = self._dispatch_queue
+        callbacks = (self.on_detection, self.on_zone_event)
+        batch_callbacks = (self.on_detection_batch, self.on_zone_event_batch)
+
+        while True:
+            with self._dispatch_cond:
+                while self._dispatch_running and not queue:
+                    self._dispatch_cond.wait()
+                if not queue:
+                    return
+                items = list(queue)
+                queue.clear()
+
+            start = 0
+            count = len(items)
+            while start < count:
+                kind = items[start][0]
+                end = start + 1
+                while end < count and items[end][0] == kind:
+                    end += 1
+                messages = [message for _, message in items[start:end]]
+                start = end
+
+                batch_callback = batch_callbacks[kind]
+                if batch_callback is not None:
+                    self._invoke(batch_callback, messages)
+                else:
+                    callback = callbacks[kind]
+                    for message in messages:
+                        self._invoke(callback, message)
+
+    def _invoke(self, callback: Callable[[Any], None], arg: Any) -> None:
+        """Run a user callback on the dispatch thread, logging failures."""
+        try:
+            callback(arg)
+        except Exception as e:
+            self.logger.error(
+                event=LogEvent.DESERIALIZATION_ERROR,
+                message="Error in message callback",
+                exc_info=e,
+                metadata={'callback': getattr(callback, '__name__', repr(callback))}
+            )
+
+    def _receive_log_due(self, count: int) -> bool:
+        """
+        Sampling gate for the per-message receive logs.
+
+        Args:
+            count: The topic's received-message count (after this message)
+
+        Returns:
+            True on every Nth message (N = log_receive_sample) when INFO is
+            enabled; always False when sampling is off
+        """
+        n = self._log_receive_sample
+        return bool(n) and count % n == 0 and self.logger.is_enabled_for(logging.INFO)
+
     def connect(self, timeout: float = 10.0) -> bool:
         """
         Connect to MQTT broker.
@@ -420,6 +653,8 @@ class MessageSubscriber:
             return
 
         self._running = True
+        if self.dispatch_queue_size:
+            self._start_dispatch_thread()
         self.client.loop_start()
 
         self.logger.info(
@@ -435,7 +670,8 @@ class MessageSubscriber:
         """
         Stop subscriber loop and disconnect.
 
-        Blocks until network loop stops (should be fast).
+        Blocks until network loop stops (should be fast) and, with
+        dispatch_queue_size set, until queued callbacks have run.
 
         Example:
             >>> subscriber.stop()
@@ -443,6 +679,7 @@ class MessageSubscriber:
         self._running = False
         self.client.loop_stop()
         self.client.disconnect()
+        self._stop_dispatch_thread()
 
         stats = self.get_stats()
         self.logger.info(
@@ -470,13 +707,13 @@ class MessageSubscriber:
             >>> stats = subscriber.get_stats()
             >>> print(f"Received {stats['detections_received']} detections")
         """
-        with self._stats_lock:
-            return {
-                'detections_received': self._message_count['detections'],
-                'zone_events_received': self._message_count['zone_events'],
-                'connected': self._connected.is_set(),
-                'running': self._running,
-                'detection_topic': self.detection_topic,
-                'zone_event_topic': self.zone_event_topic,
-                'broker': f"{self.broker_host}:{self.broker_port}"
-            }
+        return {
+            'detections_received': self._detection_count,
+            'zone_events_received': self._zone_event_count,
+            'messages_dropped': self._dropped_count,
+            'connected': self._connected.is_set(),
+            'running': self._running,
+            'detection_topic': self.detection_topic,
+            'zone_event_topic': self.zone_event_topic,
+            'broker': f"{self.broker_host}:{self.broker_port}"
+        }
@@ -6,11 +6,37 @@ including RTSP settings, model configuration, zone definitions, and MQTT
 publishing settings.
 """
 
+import os
+import stat
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Tuple, Optional
+import numpy as np
 import yaml
 
+# LibYAML-backed loader when available (~10x faster), pure-Python fallback
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Allowed values for config validation (built once, not per instance)
+_VALID_MODEL_VERSIONS = frozenset({"11", "12"})
+_VALID_MODEL_VARIANTS = frozenset({"n", "s", "m", "l", "x"})
+_VALID_MODEL_FORMATS = frozenset({"onnx", "pt"})
+_VALID_ONNX_INPUT_SIZES = frozenset({320, 640})
+_VALID_MQTT_QOS = frozenset({0, 1, 2})
+
+
+def model_filename(version: str, variant: str, input_size: int, model_format: str) -> str:
+    """
+    File name of a catalog model.
+
+    Returns:
+        str: e.g. "yolo12n-640.onnx" (ONNX, fixed size) or "yolo12n.pt"
+    """
+    if model_format == "onnx":
+        return f"yolo{version}{variant}-{input_size}.onnx"
+    return f"yolo{version}{variant}.pt"
+
 
 @dataclass(frozen=True)
 class ModelConfig:
@@ -36,34 +62,30 @@ class ModelConfig:
 
     def __post_init__(self):
         """Validate model configuration."""
-        valid_versions = {"11", "12"}
-        if self.model_version not in valid_versions:
+        if self.model_version not in _VALID_MODEL_VERSIONS:
             raise ValueError(
                 f"Invalid model_version: {self.model_version}. "
-                f"Must be one of {valid_versions}"
+                f"Must be one of {sorted(_VALID_MODEL_VERSIONS)}"
             )
 
-        valid_variants = {"n", "s", "m", "l", "x"}
-        if self.model_variant not in valid_variants:
+        if self.model_variant not in _VALID_MODEL_VARIANTS:
             raise ValueError(
                 f"Invalid model_variant: {self.model_variant}. "
-                f"Must be one of {valid_variants}"
+                f"Must be one of {sorted(_VALID_MODEL_VARIANTS)}"
             )
 
-        valid_formats = {"onnx", "pt"}
-        if self.model_format not in valid_formats:
+        if self.model_format not in _VALID_MODEL_FORMATS:
             raise ValueError(
                 f"Invalid model_format: {self.model_format}. "
-                f"Must be one of {valid_formats}"
+                f"Must be one of {sorted(_VALID_MODEL_FORMATS)}"
             )
 
         # ONNX models have fixed input sizes
         if self.model_format == "onnx":
-            valid_sizes = {320, 640}
-            if self.input_size not in valid_sizes:
+            if self.input_size not in _VALID_ONNX_INPUT_SIZES:
                 raise ValueError(
                     f"Invalid input_size for ONNX: {self.input_size}. "
-                    f"Must be one of {valid_sizes}"
+                    f"Must be one of {sorted(_VALID_ONNX_INPUT_SIZES)}"
                 )
         # PT models can accept any reasonable size
         else:  # pt
@@ -82,6 +104,19 @@ class ModelConfig:
                 f"iou_threshold must be in [0.0, 1.0], got {self.iou_threshold}"
             )
 
+        # Interned: equal values from different sources (YAML, commands)
+        # are one object, so cache-key tuples compare by identity
+        for name in ("model_version", "model_variant", "model_format"):
+            object.__setattr__(self, name, sys.intern(str(getattr(self, name))))
+
+        # ModelLoader cache key, built once (not per load_model_from_config)
+        object.__setattr__(self, "_cache_key", (
+            self.model_version, self.model_variant, self.input_size, self.model_format
+        ))
+
+        # Filename depends only on frozen fields: format it once here
+        object.__setattr__(self, "_filename", model_filename(*self._cache_key))
+
     def get_model_filename(self) -> str:
         """
         Get the model filename based on configuration.
@@ -89,34 +124,97 @@ class ModelConfig:
         Returns:
             str: Model filename (e.g., "yolo12n-640.onnx" or "yolo12n.pt")
         """
-        if self.model_format == "onnx":
-            return f"yolo{self.model_version}{self.model_variant}-{self.input_size}.onnx"
-        else:  # pt
-            return f"yolo{self.model_version}{self.model_variant}.pt"
+        return self._filename
+
+    def get_cache_key(self) -> tuple:
+        """
+        Get the ModelLoader cache key for this model.
+
+        Returns:
+            tuple: (version, variant, input_size, format)
+        """
+        return self._cache_key
+
+
+def _parse_point(zone_id: str, index: int, point) -> Tuple[int, int]:
+    """
+    Validate one zone point as an (x, y) pair of integers.
+
+    Integer-valued floats (e.g. 100.0) are accepted; fractional values,
+    bools and anything that isn't a pair are rejected, not truncated.
+
+    Raises:
+        ValueError: With the zone id and point index
+    """
+    try:
+        x, y = point
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Zone '{zone_id}' point {index} must be an (x, y) pair, got {point!r}"
+        ) from None
+
+    values = []
+    for value in (x, y):
+        if isinstance(value, (bool, np.bool_)):
+            value = None
+        elif isinstance(value, (int, np.integer)):
+            value = int(value)
+        elif isinstance(value, (float, np.floating)) and float(value).is_integer():
+            value = int(value)
+        else:
+            value = None
+        if value is None:
+            raise ValueError(
+                f"Zone '{zone_id}' point {index} must have integer coordinates, "
+                f"got {point!r}"
+            )
+        values.append(value)
+    return values[0], values[1]
 
 
 @dataclass(frozen=True)
 class ZoneConfig:
-    """Zone configuration (polygon or line)."""
+    """
+    Zone configuration (polygon or line).
+
+    coordinates accepts any sequence of (x, y) integer points (YAML lists,
+    command payloads, arrays) and is stored as a tuple of (int, int)
+    tuples, so configs stay comparable and hashable values.
+    coordinates_array is the same points as a read-only Nx2 int32 array,
+    built once: the layout PolygonZone / cv2 consume.
+    """
 
     zone_id: str
     zone_type: str  # "polygon" or "line"
-    coordinates: List[Tuple[int, int]]
+    coordinates: Tuple[Tuple[int, int], ...]
     enabled: bool = True
+    # Nx2 int32 view of coordinates (derived: excluded from eq/hash/repr)
+    coordinates_array: np.ndarray = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate zone configuration."""
+        coordinates = tuple(
+            _parse_point(self.zone_id, index, point)
+            for index, point in enumerate(self.coordinates)
+        )
+        object.__setattr__(self, "coordinates", coordinates)
+
+        array = np.array(coordinates, dtype=np.int32).reshape(-1, 2)
+        array.flags.writeable = False
+        object.__setattr__(self, "coordinates_array", array)
+
+        point_count = len(coordinates)
         if self.zone_type == "polygon":
-            if len(self.coordinates) < 3:
+            if point_count < 3:
                 raise ValueError(
                     f"Polygon zone '{self.zone_id}' must have at least 3 points, "
-                    f"got {len(self.coordinates)}"
+                    f"got {point_count}"
                 )
         elif self.zone_type == "line":
-            if len(self.coordinates) != 2:
+            if point_count != 2:
                 raise ValueError(
                     f"Line zone '{self.zone_id}' must have exactly 2 points, "
-                    f"got {len(self.coordinates)}"
+                    f"got {point_count}"
                 )
         else:
             raise ValueError(
@@ -145,7 +243,7 @@ class MQTTConfig:
                 f"MQTT port must be in [1, 65535], got {self.port}"
             )
 
-        if self.qos not in {0, 1, 2}:
+        if self.qos not in _VALID_MQTT_QOS:
             raise ValueError(
                 f"MQTT QoS must be 0, 1, or 2, got {self.qos}"
             )
@@ -205,14 +303,16 @@ class ProcessorConfig:
                 f"frame_resolution_wh dimensions too large (max 4096x4096), got {self.frame_resolution_wh}"
             )
 
-        # Validate models_dir exists
-        if not self.models_dir.exists():
+        # Validate models_dir exists and is a directory (one stat() call)
+        try:
+            mode = os.stat(self.models_dir).st_mode
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(
                 f"Models directory not found: {self.models_dir}\n"
                 f"Create directory or update 'models_dir' in config"
-            )
+            ) from None
 
-        if not self.models_dir.is_dir():
+        if not stat.S_ISDIR(mode):
             raise ValueError(
                 f"models_dir must be a directory, got file: {self.models_dir}"
             )
@@ -247,8 +347,9 @@ class ProcessorConfig:
               username: null
               password: null
         """
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f)
+        # Binary mode: LibYAML decodes the raw bytes itself
+        with open(yaml_path, "rb") as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
 
         # Parse nested configs
         model_config_data = data.get("model_config", {})
@@ -262,7 +363,7 @@ class ProcessorConfig:
             ZoneConfig(
                 zone_id=z["zone_id"],
                 zone_type=z["zone_type"],
-                coordinates=[tuple(coord) for coord in z["coordinates"]],
+                coordinates=z["coordinates"],  # validated by ZoneConfig
                 enabled=z.get("enabled", True)
             )
             for z in zones_data
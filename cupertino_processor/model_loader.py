@@ -10,15 +10,81 @@ Supports complete model catalog:
 - Both ONNX (320, 640) and PT (flexible) formats
 
 Thread Safety:
-- NOT thread-safe by design (single writer pattern)
-- Only accessed from Control Plane thread for loading
+- Single writer pattern: only the Control Plane thread calls load_model
 - Only accessed from Inference Thread for reading (via lock in service)
+- Prewarm loads run on a background worker; _cache/_inflight are
+  guarded by an internal lock
 """
 
+import gc
+import logging
+import mmap
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Any
-from ultralytics import YOLO
-from cupertino_processor.config import ModelConfig
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Any
+from cupertino_processor.config import ModelConfig, model_filename
+
+if TYPE_CHECKING:
+    # Imported on first load (_load_from_disk): ultralytics pulls in torch
+    from ultralytics import YOLO
+
+logger = logging.getLogger(__name__)
+
+# Threads reading model files into the page cache ahead of YOLO(...)
+_PREFETCH_WORKERS = 4
+
+# Model files listed by list_available_models()
+_MODEL_PREFIXES = ("yolo11", "yolo12")
+_MODEL_SUFFIXES = (".pt", ".onnx")
+
+# MAP_POPULATE (Linux) faults the whole mapping in at mmap() time
+_MAP_FLAGS = mmap.MAP_SHARED | getattr(mmap, "MAP_POPULATE", 0)
+
+
+def _prefetch_file(path: Path) -> None:
+    """
+    Pull a file into the OS page cache (best effort, errors ignored).
+
+    Maps the file read-only with MAP_POPULATE, so the kernel reads it in
+    at mmap() time, then drops the mapping: the pages stay cached and the
+    loader's later read() is served from memory. Platforms without
+    MAP_POPULATE fall back to madvise(WILLNEED) readahead.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        with mmap.mmap(fd, 0, flags=_MAP_FLAGS, prot=mmap.PROT_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+                mapped.madvise(mmap.MADV_WILLNEED)
+    except (OSError, ValueError):
+        pass  # empty file, or mmap unsupported for this file
+    finally:
+        os.close(fd)
+
+
+def _release_models(models: List["YOLO"]) -> None:
+    """
+    Free evicted models now instead of whenever the GC gets to them.
+
+    Drops the predictor (which holds the torch module / ORT session),
+    collects the reference cycles inside ultralytics objects, and returns
+    cached CUDA blocks to the driver if torch is in use.
+    """
+    for model in models:
+        model.predictor = None
+    models.clear()
+    gc.collect()
+
+    torch = sys.modules.get("torch")  # only if ultralytics already loaded it
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
 
 
 class ModelLoader:
@@ -33,10 +99,15 @@ class ModelLoader:
     - Variants: n, s, m, l, x
     - Formats: ONNX (fixed 320/640), PT (flexible)
 
+    The cache is LRU-bounded (cache_capacity models): the least recently
+    used model is evicted and freed, except the current model, which is
+    never evicted.
+
     Thread Safety:
-    - NOT inherently thread-safe (no internal locks)
     - Service layer must provide synchronization via _model_lock
     - Single writer pattern: Only Control Plane thread loads models
+    - Prewarm (opt-in) loads models on one background worker; the
+      cache and in-flight table are guarded by an internal lock
 
     Usage:
         loader = ModelLoader(models_dir=Path("./models"))
@@ -57,20 +128,68 @@ class ModelLoader:
         available = loader.list_available_models()
     """
 
-    def __init__(self, models_dir: Path):
+    def __init__(
+        self,
+        models_dir: Path,
+        prewarm_siblings: bool = False,
+        cache_capacity: int = 2
+    ):
         """
         Initialize model loader.
 
         Args:
             models_dir: Directory containing YOLO model files (.pt, .onnx)
+            prewarm_siblings: After loading an ONNX model, load the other
+                input size (320 <-> 640) in background, so a later switch
+                is a cache hit (default: False)
+            cache_capacity: Max models kept in memory (default: 2)
+
+        Raises:
+            ValueError: If cache_capacity < 1
         """
+        if cache_capacity < 1:
+            raise ValueError(f"cache_capacity must be >= 1, got {cache_capacity}")
+
         self.models_dir = models_dir
-        self._cache: Dict[tuple, YOLO] = {}
-        self._current_model: Optional[YOLO] = None
+        self.prewarm_siblings = prewarm_siblings
+        self._cache_capacity = cache_capacity
+        # Least recently used first
+        self._cache: "OrderedDict[tuple, YOLO]" = OrderedDict()
+        # cache_key -> pending background load (see prewarm())
+        self._inflight: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self._prewarm_executor: Optional[ThreadPoolExecutor] = None
+        self._current_model: Optional["YOLO"] = None
         self._current_key: Optional[tuple] = None
         self._current_config: Optional[ModelConfig] = None
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        # cache_key -> model file path, formatted once per key
+        self._paths: Dict[tuple, Path] = {}
+        # (models_dir st_mtime_ns, sorted model names) of the last scan
+        self._listing_cache: Optional[Tuple[int, Tuple[str, ...]]] = None
 
-    def load_model_from_config(self, config: ModelConfig) -> YOLO:
+    def _prefetch(self, model_path: Path) -> None:
+        """
+        Warm the page cache for a model file and its siblings in background.
+
+        Siblings are files sharing the model's name as prefix (e.g. ONNX
+        external data "yolo12n-640.onnx.data"); all are read concurrently
+        so a cold disk is kept busy while YOLO(...) initializes.
+        """
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=_PREFETCH_WORKERS,
+                thread_name_prefix="model-prefetch"
+            )
+
+        paths = [model_path]
+        paths.extend(
+            p for p in model_path.parent.glob(f"{model_path.name}?*") if p.is_file()
+        )
+        for path in paths:
+            self._prefetch_pool.submit(_prefetch_file, path)
+
+    def load_model_from_config(self, config: ModelConfig) -> "YOLO":
         """
         Load YOLO model from ModelConfig.
 
@@ -84,14 +203,9 @@ class ModelLoader:
             FileNotFoundError: If model file does not exist
             ValueError: If configuration is invalid (validated by ModelConfig)
         """
-        return self.load_model(
-            version=config.model_version,
-            variant=config.model_variant,
-            input_size=config.input_size,
-            model_format=config.model_format,
-            confidence=config.confidence,
-            iou_threshold=config.iou_threshold,
-            config=config
+        # Precomputed key: no tuple build per call
+        return self._load(
+            config.get_cache_key(), config.confidence, config.iou_threshold, config
         )
 
     def load_model(
@@ -103,7 +217,7 @@ class ModelLoader:
         confidence: float = 0.5,
         iou_threshold: float = 0.5,
         config: Optional[ModelConfig] = None
-    ) -> YOLO:
+    ) -> "YOLO":
         """
         Load YOLO model from disk or cache.
 
@@ -126,14 +240,41 @@ class ModelLoader:
         Caching Strategy:
         - Cache key: (version, variant, input_size, format)
         - Cache hit: Return cached model (reconfigure thresholds)
+        - Prewarm in flight: Wait for it, then as a cache hit
         - Cache miss: Load from disk, cache, and return
         """
-        # Build cache key
-        cache_key = (version, variant, input_size, model_format)
+        # Interned like ModelConfig's fields (strings from commands)
+        return self._load(
+            (sys.intern(version), sys.intern(variant), input_size, sys.intern(model_format)),
+            confidence,
+            iou_threshold,
+            config
+        )
 
-        # Check cache
-        if cache_key in self._cache:
-            self._current_model = self._cache[cache_key]
+    def _load(
+        self,
+        cache_key: tuple,
+        confidence: float,
+        iou_threshold: float,
+        config: Optional[ModelConfig]
+    ) -> "YOLO":
+        """Cache lookup / load for load_model() (see its docstring)."""
+        # Check cache (a model still loading in background is waited for)
+        with self._lock:
+            model = self._cache.get(cache_key)
+            if model is not None:
+                self._cache.move_to_end(cache_key)
+                pending = None
+            else:
+                pending = self._inflight.get(cache_key)
+        if pending is not None:
+            try:
+                model = self._store(cache_key, pending.result())
+            except Exception:
+                model = None  # retry below, so the caller sees the error
+
+        if model is not None:
+            self._current_model = model
             self._current_key = cache_key
             self._current_config = config
             
@@ -143,40 +284,150 @@ class ModelLoader:
             
             return self._current_model
 
-        # Determine model filename
-        if model_format == "onnx":
-            filename = f"yolo{version}{variant}-{input_size}.onnx"
-        else:  # pt
-            filename = f"yolo{version}{variant}.pt"
+        model = self._load_from_disk(cache_key)
+        model.overrides["conf"] = confidence
+        model.overrides["iou"] = iou_threshold
+
+        # Cache before switching: the outgoing model may still be serving
+        # inference until the service swaps, so it stays pinned here
+        self._store(cache_key, model)
+        self._current_model = model
+        self._current_key = cache_key
+        self._current_config = config
 
-        model_path = self.models_dir / filename
+        version, variant, input_size, model_format = cache_key
+        if self.prewarm_siblings and model_format == "onnx":
+            # ONNX files are fixed-size: the other size is a separate model
+            other_size = 320 if input_size == 640 else 640
+            self._schedule_prewarm((version, variant, other_size, model_format))
+
+        return model
+
+    def prewarm(self, configs: Iterable[ModelConfig]) -> None:
+        """
+        Load models into the cache in background (opt-in).
+
+        Returns immediately; a later load_model() for one of these models
+        is a cache hit, or waits for the load already in progress.
+        Missing files are logged and skipped.
+
+        Args:
+            configs: Models likely to be requested (e.g. at service startup)
+        """
+        for config in configs:
+            self._schedule_prewarm(config.get_cache_key())
+
+    def _schedule_prewarm(self, cache_key: tuple) -> None:
+        """Queue a background load unless cached or already in flight."""
+        with self._lock:
+            if cache_key in self._cache or cache_key in self._inflight:
+                return
+            if self._prewarm_executor is None:
+                self._prewarm_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="model-prewarm"
+                )
+            self._inflight[cache_key] = self._prewarm_executor.submit(
+                self._prewarm_load, cache_key
+            )
+
+    def _prewarm_load(self, cache_key: tuple) -> "YOLO":
+        """Load one model into the cache (prewarm worker thread)."""
+        try:
+            return self._store(cache_key, self._load_from_disk(cache_key))
+        except Exception as e:
+            logger.warning(f"Model prewarm failed for {cache_key}: {e}")
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(cache_key, None)
+
+    def _store(self, cache_key: tuple, model: "YOLO") -> "YOLO":
+        """
+        Insert a model as most recently used and evict over capacity.
+
+        Returns:
+            The cached model (an existing entry for cache_key wins)
+        """
+        with self._lock:
+            model = self._cache.setdefault(cache_key, model)
+            self._cache.move_to_end(cache_key)
+            evicted = self._evict_locked(keep=cache_key)
+        if evicted:
+            _release_models(evicted)
+        return model
+
+    def _evict_locked(self, keep: Optional[tuple] = None) -> List["YOLO"]:
+        """Pop LRU models over capacity (caller holds _lock).
+
+        The current model and `keep` are never evicted.
+        """
+        evicted = []
+        pinned = (keep, self._current_key)
+        for key in list(self._cache):
+            if len(self._cache) <= self._cache_capacity:
+                break
+            if key not in pinned:
+                evicted.append(self._cache.pop(key))
+        return evicted
+
+    def set_capacity(self, capacity: int) -> None:
+        """
+        Change the max number of cached models, evicting if needed.
+
+        Args:
+            capacity: Max models kept in memory (>= 1)
+
+        Raises:
+            ValueError: If capacity < 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        with self._lock:
+            self._cache_capacity = capacity
+            evicted = self._evict_locked()
+        if evicted:
+            _release_models(evicted)
+
+    def _model_path(self, cache_key: tuple) -> Path:
+        """Model file path for a cache key (formatted on first use per key)."""
+        model_path = self._paths.get(cache_key)
+        if model_path is None:
+            model_path = self._paths[cache_key] = (
+                self.models_dir / model_filename(*cache_key)
+            )
+        return model_path
+
+    def _load_from_disk(self, cache_key: tuple) -> "YOLO":
+        """
+        Load a YOLO model file (no caching, thresholds left at defaults).
+
+        Raises:
+            FileNotFoundError: If model file does not exist
+        """
+        model_path = self._model_path(cache_key)
 
         # Check if file exists
         if not model_path.exists():
             raise FileNotFoundError(
                 f"Model file not found: {model_path}\n"
-                f"Expected: {filename}\n"
+                f"Expected: {model_path.name}\n"
                 f"Available models:\n" + "\n".join(f"  - {m}" for m in self.list_available_models())
             )
 
-        # Load model
+        from ultralytics import YOLO  # deferred: seconds of import (torch)
+
+        # Start reading weights into the page cache, then load (a cold
+        # read overlaps with YOLO's own setup instead of preceding it)
+        self._prefetch(model_path)
         model = YOLO(str(model_path))
 
         # Configure model for inference
         model.overrides["verbose"] = False
-        model.overrides["imgsz"] = input_size
-        model.overrides["conf"] = confidence
-        model.overrides["iou"] = iou_threshold
-
-        # Cache and set as current
-        self._cache[cache_key] = model
-        self._current_model = model
-        self._current_key = cache_key
-        self._current_config = config
+        model.overrides["imgsz"] = cache_key[2]  # input_size
 
         return model
 
-    def get_current_model(self) -> Optional[YOLO]:
+    def get_current_model(self) -> Optional["YOLO"]:
         """
         Get the currently loaded model.
 
@@ -207,21 +458,13 @@ class ModelLoader:
             return None
 
         version, variant, input_size, model_format = self._current_key
-        
-        # Reconstruct filename
-        if model_format == "onnx":
-            filename = f"yolo{version}{variant}-{input_size}.onnx"
-        else:
-            filename = f"yolo{version}{variant}.pt"
-        
-        model_path = self.models_dir / filename
 
         return {
             "version": version,
             "variant": variant,
             "input_size": input_size,
             "format": model_format,
-            "model_path": str(model_path),
+            "model_path": str(self._model_path(self._current_key)),
         }
     
     def get_current_config(self) -> Optional[ModelConfig]:
@@ -242,27 +485,34 @@ class ModelLoader:
 
         Example:
             ["yolo11n-320.onnx", "yolo11n-640.onnx", "yolo11n.pt", ...]
+
+        The scan is cached and reused while the directory's mtime is
+        unchanged (adding, removing or renaming a file updates it).
         """
-        if not self.models_dir.exists():
+        try:
+            mtime = os.stat(self.models_dir).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+        cached = self._listing_cache
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
+        # One directory pass for both formats (YOLO11/12 .pt and .onnx)
+        try:
+            with os.scandir(self.models_dir) as entries:
+                models = tuple(sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.name.startswith(_MODEL_PREFIXES)
+                    and entry.name.endswith(_MODEL_SUFFIXES)
+                    and entry.is_file()
+                ))
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
-        models = []
-        
-        # Find all YOLO11/12 .pt files
-        models.extend([
-            f.name
-            for f in self.models_dir.glob("yolo1[12]*.pt")
-            if f.is_file()
-        ])
-        
-        # Find all YOLO11/12 .onnx files
-        models.extend([
-            f.name
-            for f in self.models_dir.glob("yolo1[12]*.onnx")
-            if f.is_file()
-        ])
-        
-        return sorted(models)
+        self._listing_cache = (mtime, models)
+        return list(models)
 
     def clear_cache(self) -> None:
         """
@@ -273,7 +523,8 @@ class ModelLoader:
 
         Use with caution - only call when pipeline is stopped.
         """
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
         self._current_model = None
         self._current_key = None
 
@@ -10,31 +10,38 @@ REFACTORED for cupertino_zone v2.0 API:
 - Maintains backward-compatible API
 
 Thread Safety:
-- Uses threading.Lock for protecting zone dict mutations
-- Snapshot pattern for trigger() to minimize lock holding time
+- Uses threading.Lock for protecting zone dict mutations (writers only)
+- Writers publish an immutable tuple of enabled zones; trigger() reads it
+  without taking the lock
 - Zone objects are immutable (frozen dataclass)
 """
 
+import sys
 import threading
-from typing import Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field, replace
 import numpy as np
-import supervision as sv
 
 # New cupertino_zone API (v2.0)
 from cupertino_zone import PolygonZone, LineZone, ZoneDetector
 from cupertino_zone.analytics import ZoneCounter, ZoneStats, CrossingTracker
 
+if TYPE_CHECKING:
+    import supervision as sv  # annotations only
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ManagedZone:
     """
     Encapsulates zone geometry, counter, and tracker for registry management.
 
     Design:
     - Separation of concerns: geometry + analytics
-    - Type-safe: stores zone type explicitly
+    - Type-safe: stores zone type explicitly (resolved once at construction,
+      so per-frame dispatch is a string compare, not isinstance)
     - Tracker only for line zones
+    - Frozen: enable/disable replaces the entry (sharing counter and
+      tracker), so published snapshots never change under a reader
     """
 
     zone_id: str
@@ -42,22 +49,38 @@ class ManagedZone:
     counter: ZoneCounter
     tracker: CrossingTracker | None = None  # Only for LineZone
     enabled: bool = True
+    zone_type: str = field(init=False)  # "polygon", "line" or "unknown"
 
-    @property
-    def zone_type(self) -> str:
-        """Get zone type string."""
+    def __post_init__(self):
+        """Resolve zone type string."""
         if isinstance(self.zone, PolygonZone):
-            return "polygon"
+            zone_type = "polygon"
         elif isinstance(self.zone, LineZone):
-            return "line"
+            zone_type = "line"
         else:
-            return "unknown"
+            zone_type = "unknown"
+        object.__setattr__(self, "zone_type", zone_type)
 
     def get_stats(self) -> ZoneStats:
         """Get current statistics snapshot."""
         return self.counter.get_stats()
 
 
+class _Snapshot(NamedTuple):
+    """Enabled zones as published to trigger() (swapped as one object)."""
+
+    zones: Tuple[ManagedZone, ...]
+    # Geometry of the enabled polygon zones, in zones order (one batched
+    # detection per frame; row i of the masks is the i-th polygon zone)
+    polygons: Tuple[PolygonZone, ...]
+    # Enabled line zones, in zones order (one batched crossing detection)
+    line_zones: Tuple[ManagedZone, ...]
+    lines: Tuple[LineZone, ...]
+
+
+_EMPTY_SNAPSHOT = _Snapshot((), (), (), ())
+
+
 class ZoneMonitorRegistry:
     """
     Thread-safe registry for zone monitors (REFACTORED for v2.0 API).
@@ -66,18 +89,27 @@ class ZoneMonitorRegistry:
     - Geometry layer (PolygonZone/LineZone)
     - Analytics layer (ZoneCounter, CrossingTracker)
 
-    The trigger() method uses a snapshot pattern to minimize lock contention:
-    1. Acquire lock
-    2. Create snapshot of enabled zones
-    3. Release lock
-    4. Process detections (long operation)
+    The trigger() method reads a published snapshot, without locking:
+    1. Writers mutate the zone dict under the lock
+    2. Writers rebuild the tuple of enabled zones and swap it in
+       (one attribute assignment, atomic)
+    3. trigger() iterates whatever tuple is current
+
+    Writers are rare (config load, control commands) and trigger() runs
+    every frame (RCU-style): all snapshot work, including grouping zones
+    by type, happens per config change, not per frame.
 
     Thread Safety Guarantees:
     - add_zone(), remove_zone(), update_zone(): Write operations (acquire lock)
     - enable_zone(), disable_zone(): Write operations (acquire lock)
-    - trigger(): Read operation with snapshot (acquire lock briefly)
+    - trigger(): Lock-free read of the enabled-zones snapshot
     - list_zones(), get_zone_info(): Read operations (acquire lock briefly)
 
+    trigger() is meant for one inference thread per registry: the snapshot
+    read is a plain attribute load (any number of threads can do it), but
+    zone counters and crossing trackers are updated in place. For several
+    streams, use one registry per stream.
+
     Usage (NEW API):
         registry = ZoneMonitorRegistry()
 
@@ -102,6 +134,31 @@ class ZoneMonitorRegistry:
         """Initialize empty registry."""
         self._managed_zones: Dict[str, ManagedZone] = {}
         self._lock = threading.Lock()
+        # Enabled zones, rebuilt by every writer (read lock-free by trigger)
+        self._snapshot: _Snapshot = _EMPTY_SNAPSHOT
+
+    def _publish_snapshot(self) -> None:
+        """Rebuild the enabled-zones snapshot (caller holds _lock)."""
+        zones = tuple(
+            managed_zone
+            for managed_zone in self._managed_zones.values()
+            if managed_zone.enabled
+        )
+        line_zones = tuple(
+            managed_zone
+            for managed_zone in zones
+            if managed_zone.zone_type == "line"
+        )
+        self._snapshot = _Snapshot(
+            zones=zones,
+            polygons=tuple(
+                managed_zone.zone
+                for managed_zone in zones
+                if managed_zone.zone_type == "polygon"
+            ),
+            line_zones=line_zones,
+            lines=tuple(managed_zone.zone for managed_zone in line_zones),
+        )
 
     def add_polygon_zone(self, zone_id: str, zone: PolygonZone) -> None:
         """
@@ -116,6 +173,11 @@ class ZoneMonitorRegistry:
 
         Thread-safe: Acquires lock for write operation.
         """
+        # Interned: ids from commands/config become one object, so later
+        # lookups (and the ZoneCounter's zone_id) compare by identity
+        if type(zone_id) is str:
+            zone_id = sys.intern(zone_id)
+
         managed_zone = ManagedZone(
             zone_id=zone_id,
             zone=zone,
@@ -125,9 +187,10 @@ class ZoneMonitorRegistry:
         )
         
         with self._lock:
-            if zone_id in self._managed_zones:
+            # setdefault: one lookup for the duplicate check and the insert
+            if self._managed_zones.setdefault(zone_id, managed_zone) is not managed_zone:
                 raise ValueError(f"Zone '{zone_id}' already exists")
-            self._managed_zones[zone_id] = managed_zone
+            self._publish_snapshot()
 
     def add_line_zone(self, zone_id: str, zone: LineZone) -> None:
         """
@@ -142,6 +205,11 @@ class ZoneMonitorRegistry:
 
         Thread-safe: Acquires lock for write operation.
         """
+        # Interned: ids from commands/config become one object, so later
+        # lookups (and the ZoneCounter's zone_id) compare by identity
+        if type(zone_id) is str:
+            zone_id = sys.intern(zone_id)
+
         managed_zone = ManagedZone(
             zone_id=zone_id,
             zone=zone,
@@ -151,9 +219,10 @@ class ZoneMonitorRegistry:
         )
         
         with self._lock:
-            if zone_id in self._managed_zones:
+            # setdefault: one lookup for the duplicate check and the insert
+            if self._managed_zones.setdefault(zone_id, managed_zone) is not managed_zone:
                 raise ValueError(f"Zone '{zone_id}' already exists")
-            self._managed_zones[zone_id] = managed_zone
+            self._publish_snapshot()
 
     def add_zone(self, zone_id: str, zone: PolygonZone | LineZone) -> None:
         """
@@ -188,9 +257,9 @@ class ZoneMonitorRegistry:
         Thread-safe: Acquires lock for write operation.
         """
         with self._lock:
-            if zone_id not in self._managed_zones:
+            if self._managed_zones.pop(zone_id, None) is None:
                 raise KeyError(f"Zone '{zone_id}' not found")
-            del self._managed_zones[zone_id]
+            self._publish_snapshot()
 
     def update_zone(self, zone_id: str, zone: PolygonZone | LineZone) -> None:
         """
@@ -207,10 +276,10 @@ class ZoneMonitorRegistry:
         Thread-safe: Acquires lock for write operation.
         """
         with self._lock:
-            if zone_id not in self._managed_zones:
+            old_managed = self._managed_zones.get(zone_id)
+            if old_managed is None:
                 raise KeyError(f"Zone '{zone_id}' not found")
 
-            old_managed = self._managed_zones[zone_id]
             old_enabled = old_managed.enabled
 
             # Verify type consistency
@@ -239,6 +308,7 @@ class ZoneMonitorRegistry:
                 )
 
             self._managed_zones[zone_id] = new_managed
+            self._publish_snapshot()
 
     def enable_zone(self, zone_id: str) -> None:
         """
@@ -253,9 +323,11 @@ class ZoneMonitorRegistry:
         Thread-safe: Acquires lock for write operation.
         """
         with self._lock:
-            if zone_id not in self._managed_zones:
+            managed = self._managed_zones.get(zone_id)
+            if managed is None:
                 raise KeyError(f"Zone '{zone_id}' not found")
-            self._managed_zones[zone_id].enabled = True
+            self._managed_zones[zone_id] = replace(managed, enabled=True)
+            self._publish_snapshot()
 
     def disable_zone(self, zone_id: str) -> None:
         """
@@ -270,23 +342,23 @@ class ZoneMonitorRegistry:
         Thread-safe: Acquires lock for write operation.
         """
         with self._lock:
-            if zone_id not in self._managed_zones:
+            managed = self._managed_zones.get(zone_id)
+            if managed is None:
                 raise KeyError(f"Zone '{zone_id}' not found")
-            self._managed_zones[zone_id].enabled = False
+            self._managed_zones[zone_id] = replace(managed, enabled=False)
+            self._publish_snapshot()
 
     def trigger(
         self,
-        detections: sv.Detections,
+        detections: "sv.Detections",
         class_names: Dict[int, str] | None = None
     ) -> Dict[str, Tuple[np.ndarray, ZoneStats]]:
         """
         Trigger all enabled zones with detections (NEW API v2.0).
 
-        This method uses a snapshot pattern to minimize lock holding time:
-        1. Acquire lock and create snapshot of enabled zones
-        2. Release lock
-        3. Process detections (potentially slow operation)
-        4. Update counters and get stats
+        Iterates the enabled-zones snapshot published by the writers:
+        no lock, no per-frame copy. Zones changed during the call take
+        effect on the next frame.
 
         Args:
             detections: Supervision Detections object
@@ -298,7 +370,7 @@ class ZoneMonitorRegistry:
             - For line zones: mask is tuple (crossed_in, crossed_out)
             - stats is ZoneStats with counts
 
-        Thread-safe: Minimizes lock contention by using snapshot pattern.
+        Thread-safe: Lock-free read of the immutable snapshot.
 
         Example:
             detections = sv.Detections(...)
@@ -308,21 +380,34 @@ class ZoneMonitorRegistry:
             #     "crossing": ((in_mask, out_mask), ZoneStats(...))
             # }
         """
-        # Snapshot pattern: acquire lock, copy references, release
-        with self._lock:
-            zones_snapshot = [
-                managed_zone
-                for managed_zone in self._managed_zones.values()
-                if managed_zone.enabled
-            ]
+        # One attribute load: writers swap in a new snapshot, never mutate it
+        snapshot = self._snapshot
+
+        # All polygon zones in one pass: anchors computed once, (Z, N) masks
+        if snapshot.polygons:
+            polygon_masks = ZoneDetector.detect_polygons(snapshot.polygons, detections)
+        polygon_row = 0
+
+        # All line zones in one pass: (L, N) sides vs each zone's last sides
+        if snapshot.lines:
+            line_crossings = ZoneDetector.detect_line_crossings(
+                snapshot.lines,
+                detections,
+                [
+                    managed_zone.tracker.state if managed_zone.tracker is not None else {}
+                    for managed_zone in snapshot.line_zones
+                ]
+            )
+        line_row = 0
 
-        # Process detections outside lock (long operation)
         results = {}
         
-        for managed_zone in zones_snapshot:
-            if isinstance(managed_zone.zone, PolygonZone):
-                # Detect which objects are in polygon
-                mask = ZoneDetector.detect_polygon(managed_zone.zone, detections)
+        for managed_zone in snapshot.zones:
+            zone_type = managed_zone.zone_type
+            if zone_type == "polygon":
+                # Which objects are in polygon (row of the batched masks)
+                mask = polygon_masks[polygon_row]
+                polygon_row += 1
                 
                 # Update counter
                 managed_zone.counter.update_polygon(mask, detections, class_names)
@@ -330,18 +415,15 @@ class ZoneMonitorRegistry:
                 
                 results[managed_zone.zone_id] = (mask, stats)
                 
-            elif isinstance(managed_zone.zone, LineZone):
+            elif zone_type == "line":
                 # Detect line crossings (requires tracker state)
                 if managed_zone.tracker is None:
                     raise RuntimeError(
                         f"Line zone '{managed_zone.zone_id}' missing tracker"
                     )
                 
-                crossed_in, crossed_out, new_state = ZoneDetector.detect_line_crossing(
-                    managed_zone.zone, 
-                    detections, 
-                    managed_zone.tracker.state
-                )
+                crossed_in, crossed_out, new_state = line_crossings[line_row]
+                line_row += 1
                 
                 # Update tracker state
                 managed_zone.tracker.state = new_state
@@ -391,15 +473,14 @@ class ZoneMonitorRegistry:
         Thread-safe: Acquires lock for read operation.
         """
         with self._lock:
-            if zone_id not in self._managed_zones:
+            managed = self._managed_zones.get(zone_id)
+            if managed is None:
                 raise KeyError(f"Zone '{zone_id}' not found")
 
-            managed = self._managed_zones[zone_id]
-
             # Extract coordinates based on zone type
-            if isinstance(managed.zone, PolygonZone):
+            if managed.zone_type == "polygon":
                 coordinates = managed.zone.vertices.tolist()
-            elif isinstance(managed.zone, LineZone):
+            elif managed.zone_type == "line":
                 coordinates = [
                     list(managed.zone.start),
                     list(managed.zone.end)
@@ -430,9 +511,10 @@ class ZoneMonitorRegistry:
         Thread-safe: Acquires lock for read operation.
         """
         with self._lock:
-            if zone_id not in self._managed_zones:
+            managed = self._managed_zones.get(zone_id)
+            if managed is None:
                 raise KeyError(f"Zone '{zone_id}' not found")
-            return self._managed_zones[zone_id].get_stats()
+            return managed.get_stats()
 
     def clear(self) -> None:
         """
@@ -442,6 +524,7 @@ class ZoneMonitorRegistry:
         """
         with self._lock:
             self._managed_zones.clear()
+            self._publish_snapshot()
 
     def count(self) -> int:
         """
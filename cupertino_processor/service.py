@@ -178,11 +178,11 @@ class StreamProcessorService:
         Returns:
             PolygonZone or LineZone instance
         """
-        coordinates = np.array(zone_config.coordinates, dtype=np.int32)
+        coordinates = zone_config.coordinates
 
         if zone_config.zone_type == "polygon":
             zone = PolygonZone(
-                vertices=coordinates,
+                vertices=zone_config.coordinates_array,  # Nx2 int32, read-only
                 frame_resolution_wh=self.config.frame_resolution_wh
             )
             return zone
@@ -544,15 +544,28 @@ class StreamProcessorService:
         """
         detections = pred["detections"]
 
+        # sv.Detections is already column-oriented (SoA): convert each column
+        # to Python values in one tolist() call, then zip the rows, instead
+        # of indexing the numpy arrays per box
+        bboxes = detections.xyxy.tolist()
+        confidences = detections.confidence.tolist()
+        class_ids = detections.class_id.tolist()
+        if detections.tracker_id is not None:
+            tracker_ids = detections.tracker_id.tolist()
+        else:
+            tracker_ids = [None] * len(bboxes)
+
         # Convert detections to list of dicts
-        detection_list = []
-        for i in range(len(detections)):
-            detection_list.append({
-                "bbox": detections.xyxy[i].tolist(),
-                "confidence": float(detections.confidence[i]),
-                "class_id": int(detections.class_id[i]),
-                "tracker_id": int(detections.tracker_id[i]) if detections.tracker_id is not None else None,
-            })
+        detection_list = [
+            {
+                "bbox": bbox,
+                "confidence": confidence,
+                "class_id": class_id,
+                "tracker_id": tracker_id,
+            }
+            for bbox, confidence, class_id, tracker_id
+            in zip(bboxes, confidences, class_ids, tracker_ids)
+        ]
 
         return {
             "service_id": self.config.service_id,
@@ -614,12 +627,10 @@ class StreamProcessorService:
         """Handle add_zone command (Control Plane Thread)."""
         zone_id = command["zone_id"]
         zone_type = command["zone_type"]
-        coordinates = [tuple(c) for c in command["coordinates"]]
-
         zone_config = ZoneConfig(
             zone_id=zone_id,
             zone_type=zone_type,
-            coordinates=coordinates,
+            coordinates=command["coordinates"],  # validated by ZoneConfig
             enabled=True
         )
 
@@ -14,18 +14,21 @@ Design:
 import supervision as sv
 import numpy as np
 from dataclasses import dataclass, field
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 from collections import defaultdict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZoneStats:
     """
     Immutable statistics snapshot for a zone.
 
     Design:
-    - Frozen dataclass (thread-safe read)
+    - Frozen, slotted dataclass (thread-safe read, no per-instance __dict__)
     - Value object (no identity)
+    - classwise_counts is a read-only mapping (dicts are copied), so a
+      snapshot shared between callers can't be mutated through it
     - Can be serialized to JSON/MQTT
     """
 
@@ -33,7 +36,14 @@ class ZoneStats:
     current_count: int = 0
     total_entered: int = 0
     total_exited: int = 0
-    classwise_counts: Dict[str, int] = field(default_factory=dict)
+    classwise_counts: Mapping[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Freeze classwise_counts."""
+        if type(self.classwise_counts) is not MappingProxyType:
+            object.__setattr__(
+                self, 'classwise_counts', MappingProxyType(dict(self.classwise_counts))
+            )
 
     def __str__(self) -> str:
         """Human-readable representation."""
@@ -85,6 +95,9 @@ class ZoneCounter:
         # Classwise counts (shared by both modes)
         self._classwise_counts: Dict[str, int] = defaultdict(int)
 
+        # Last get_stats() snapshot; None once an update changes the counts
+        self._stats: Optional[ZoneStats] = None
+
     def update_polygon(
         self,
         mask: np.ndarray,
@@ -99,6 +112,8 @@ class ZoneCounter:
             detections: All detections
             class_names: Optional mapping {class_id: name}
         """
+        self._stats = None
+
         # Current count = sum of mask
         self._current_count = int(mask.sum())
 
@@ -130,9 +145,15 @@ class ZoneCounter:
             detections: All detections
             class_names: Optional mapping {class_id: name}
         """
+        entered = int(crossed_in.sum())
+        exited = int(crossed_out.sum())
+        if entered == 0 and exited == 0:
+            return  # most frames: nothing crossed, stats snapshot stays valid
+        self._stats = None
+
         # Accumulate total crossings
-        self._total_entered += int(crossed_in.sum())
-        self._total_exited += int(crossed_out.sum())
+        self._total_entered += entered
+        self._total_exited += exited
 
         # Update classwise counts (accumulative for line zones)
         if detections.class_id is not None and len(crossed_in) > 0:
@@ -155,15 +176,19 @@ class ZoneCounter:
         Get immutable statistics snapshot.
 
         Returns:
-            Frozen ZoneStats with current state
+            Frozen ZoneStats with current state (the same object until
+            the counts change)
         """
-        return ZoneStats(
-            zone_id=self.zone_id,
-            current_count=self._current_count,
-            total_entered=self._total_entered,
-            total_exited=self._total_exited,
-            classwise_counts=dict(self._classwise_counts)  # Copy dict
-        )
+        stats = self._stats
+        if stats is None:
+            stats = self._stats = ZoneStats(
+                zone_id=self.zone_id,
+                current_count=self._current_count,
+                total_entered=self._total_entered,
+                total_exited=self._total_exited,
+                classwise_counts=self._classwise_counts  # Copied read-only
+            )
+        return stats
 
     def reset(self) -> None:
         """Reset all counters to zero."""
@@ -171,3 +196,4 @@ class ZoneCounter:
         self._total_entered = 0
         self._total_exited = 0
         self._classwise_counts.clear()
+        self._stats = None
@@ -13,10 +13,13 @@ Design:
 
 import numpy as np
 import supervision as sv
-from typing import Dict, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 from cupertino_zone.geometry.shapes import PolygonZone, LineZone
 
+# Previous-side marker for tracker IDs without state (sides are -1, 0, 1)
+_NO_SIDE = 2
+
 
 class ZoneDetector:
     """
@@ -52,13 +55,34 @@ class ZoneDetector:
         # Get anchor points from bounding boxes
         anchors = detections.get_anchors_coordinates(anchor=anchor)
 
-        # Test each anchor against polygon
-        mask = np.array([
-            zone.contains_point((x, y))
-            for x, y in anchors
-        ], dtype=bool)
+        # Test all anchors against polygon in one mask lookup
+        return zone.contains_points(anchors)
+
+    @staticmethod
+    def detect_polygons(
+        zones: Sequence[PolygonZone],
+        detections: sv.Detections,
+        anchor: sv.Position = sv.Position.BOTTOM_CENTER
+    ) -> np.ndarray:
+        """
+        Detect which detections are inside each of several polygon zones.
 
-        return mask
+        Anchor points are computed once and shared by all zones, instead
+        of once per detect_polygon() call.
+
+        Args:
+            zones: Polygon geometries
+            detections: YOLO detections with bounding boxes
+            anchor: Which point of bbox to test (default: BOTTOM_CENTER)
+
+        Returns:
+            Boolean matrix of shape (Z, N): row i is the mask of zones[i]
+        """
+        if len(zones) == 0 or len(detections) == 0:
+            return np.zeros((len(zones), len(detections)), dtype=bool)
+
+        anchors = detections.get_anchors_coordinates(anchor=anchor)
+        return np.stack([zone.contains_points(anchors) for zone in zones])
 
     @staticmethod
     def detect_line_crossing(
@@ -94,6 +118,39 @@ class ZoneDetector:
         - No side effects on zone or detector
         - Thread-safe (no mutations)
         """
+        return ZoneDetector.detect_line_crossings(
+            (zone,), detections, (tracker_state,), anchor
+        )[0]
+
+    @staticmethod
+    def detect_line_crossings(
+        zones: Sequence[LineZone],
+        detections: sv.Detections,
+        tracker_states: Sequence[Dict[int, int]],
+        anchor: sv.Position = sv.Position.BOTTOM_CENTER
+    ) -> List[Tuple[np.ndarray, np.ndarray, Dict[int, int]]]:
+        """
+        Detect line crossings for several line zones in one pass.
+
+        Same semantics as detect_line_crossing() per zone; anchors are
+        computed once and the sides of every detection against every line
+        come from one (L, N) array operation.
+
+        Args:
+            zones: Line geometries
+            detections: YOLO detections with tracker_id required
+            tracker_states: External state per zone {tracker_id: last_side}
+            anchor: Which point of bbox to test
+
+        Returns:
+            (crossed_in, crossed_out, updated_state) per zone, in zones order
+
+        Raises:
+            ValueError: If detections lack tracker_id (and zones is non-empty)
+        """
+        if len(zones) == 0:
+            return []
+
         # Validate tracker_id presence
         if detections.tracker_id is None:
             raise ValueError(
@@ -102,34 +159,41 @@ class ZoneDetector:
             )
 
         if len(detections) == 0:
-            return np.array([], dtype=bool), np.array([], dtype=bool), tracker_state
+            return [
+                (np.array([], dtype=bool), np.array([], dtype=bool), tracker_state)
+                for tracker_state in tracker_states
+            ]
 
         # Get anchor points
-        anchors = detections.get_anchors_coordinates(anchor=anchor)
-
-        # Initialize result masks
-        crossed_in = np.zeros(len(detections), dtype=bool)
-        crossed_out = np.zeros(len(detections), dtype=bool)
-
-        # Copy state for immutability (don't mutate input)
-        new_state = tracker_state.copy()
-
-        # Check each detection
-        for idx, (tracker_id, (x, y)) in enumerate(zip(detections.tracker_id, anchors)):
-            current_side = zone.get_side((x, y))
+        anchors = detections.get_anchors_coordinates(anchor=anchor).astype(np.float64)
+
+        # Side of every anchor w.r.t. every line: sign((p - start) . normal),
+        # as in LineZone.get_sides(), for all lines at once -> (L, N)
+        starts = np.stack([zone._start_arr for zone in zones])
+        normals = np.stack([zone._normal for zone in zones])
+        sides = np.sign(
+            ((anchors[None, :, :] - starts[:, None, :]) * normals[:, None, :]).sum(axis=-1)
+        ).astype(np.int8)
+
+        tracker_ids = detections.tracker_id.tolist()
+        results = []
+        for zone_sides, tracker_state in zip(sides, tracker_states):
+            # Previous side per detection (_NO_SIDE: not seen before)
+            previous = np.array(
+                [tracker_state.get(tracker_id, _NO_SIDE) for tracker_id in tracker_ids],
+                dtype=np.int8
+            )
 
-            # Check for crossing (requires previous state)
-            if tracker_id in tracker_state:
-                previous_side = tracker_state[tracker_id]
+            # Crossing = side change onto a side (not onto the line) of a
+            # tracked object: 1 = moved to left (IN), -1 = to right (OUT)
+            changed = (previous != _NO_SIDE) & (previous != zone_sides)
+            crossed_in = changed & (zone_sides == 1)
+            crossed_out = changed & (zone_sides == -1)
 
-                # Detect crossing (side change)
-                if previous_side != current_side and current_side != 0:
-                    if current_side == 1:  # Moved to left (IN)
-                        crossed_in[idx] = True
-                    elif current_side == -1:  # Moved to right (OUT)
-                        crossed_out[idx] = True
+            # Copy state for immutability (don't mutate input)
+            new_state = tracker_state.copy()
+            new_state.update(zip(tracker_ids, zone_sides.tolist()))
 
-            # Update state
-            new_state[tracker_id] = current_side
+            results.append((crossed_in, crossed_out, new_state))
 
-        return crossed_in, crossed_out, new_state
+        return results
@@ -53,6 +53,20 @@ class PolygonZone:
         mask = self._create_mask()
         object.__setattr__(self, '_mask', mask)
 
+        # Bounding box of the mask's True pixels (x0, y0, x1, y1; exclusive
+        # ends) and the mask cropped to it: batched queries reject points
+        # outside the box with compares and gather from the small crop
+        cols = np.flatnonzero(mask.any(axis=0))
+        rows = np.flatnonzero(mask.any(axis=1))
+        if len(cols) == 0:
+            aabb = (0, 0, 0, 0)  # polygon covers no pixel
+        else:
+            aabb = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+        object.__setattr__(self, '_aabb', aabb)
+        object.__setattr__(self, '_mask_crop', np.ascontiguousarray(
+            mask[aabb[1]:aabb[3], aabb[0]:aabb[2]]
+        ))
+
         # Make vertices read-only
         self.vertices.flags.writeable = False
 
@@ -95,6 +109,30 @@ class PolygonZone:
 
         return bool(self._mask[y, x])
 
+    def contains_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Vectorized contains_point() for many points (one mask gather).
+
+        Args:
+            points: Mx2 array of (x, y) coordinates
+
+        Returns:
+            Boolean array of shape (M,), True where the point is inside
+        """
+        points = np.asarray(points)
+        # astype truncates toward zero, like int() in contains_point()
+        xs = points[:, 0].astype(np.intp)
+        ys = points[:, 1].astype(np.intp)
+
+        # Outside the polygon's bounding box (which lies within the frame)
+        # is outside the polygon: only points in the box touch the mask
+        x0, y0, x1, y1 = self._aabb
+        in_box = (xs >= x0) & (xs < x1) & (ys >= y0) & (ys < y1)
+
+        inside = np.zeros(len(points), dtype=bool)
+        inside[in_box] = self._mask_crop[ys[in_box] - y0, xs[in_box] - x0]
+        return inside
+
 
 @dataclass(frozen=True)
 class LineZone:
@@ -119,12 +157,19 @@ class LineZone:
         if self.start == self.end:
             raise ValueError("Line start and end must be different points")
 
-        # Precompute line vector (using object.__setattr__ for frozen)
-        vector = np.array([
-            self.end[0] - self.start[0],
-            self.end[1] - self.start[1]
-        ])
-        object.__setattr__(self, '_vector', vector)
+        # Precompute line vector (using object.__setattr__ for frozen) as
+        # plain floats: get_side() is scalar math, no per-call arrays
+        start_x, start_y = float(self.start[0]), float(self.start[1])
+        dx = float(self.end[0]) - start_x
+        dy = float(self.end[1]) - start_y
+        object.__setattr__(self, '_start_xy', (start_x, start_y))
+        object.__setattr__(self, '_vector', (dx, dy))
+
+        # Same test in array form for get_sides(): the cross product
+        # (end - start) x (p - start) is (p - start) . (-dy, dx). float64,
+        # so float32 detection coordinates don't round near the line
+        object.__setattr__(self, '_start_arr', np.array([start_x, start_y]))
+        object.__setattr__(self, '_normal', np.array([-dy, dx]))
 
     def get_side(self, point: Tuple[float, float]) -> int:
         """
@@ -140,14 +185,12 @@ class LineZone:
             -1: right side of line (cross product < 0)
             0: on the line (cross product == 0)
         """
-        # Vector from start to point
-        to_point = np.array([
-            point[0] - self.start[0],
-            point[1] - self.start[1]
-        ])
+        start_x, start_y = self._start_xy
+        dx, dy = self._vector
 
-        # Cross product determines side
-        cross = np.cross(self._vector, to_point)
+        # Cross product (end - start) x (point - start) determines side
+        # (float(): numpy float32 inputs would otherwise keep the math in float32)
+        cross = dx * (float(point[1]) - start_y) - dy * (float(point[0]) - start_x)
 
         if cross > 0:
             return 1  # Left side
@@ -155,3 +198,16 @@ class LineZone:
             return -1  # Right side
         else:
             return 0  # On line
+
+    def get_sides(self, points: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_side() for many points (one matrix-vector product).
+
+        Args:
+            points: Mx2 array of (x, y) coordinates
+
+        Returns:
+            int8 array of shape (M,) with 1 (left), -1 (right), 0 (on line)
+        """
+        points = np.asarray(points, dtype=np.float64)
+        return np.sign((points - self._start_arr) @ self._normal).astype(np.int8)
@@ -48,7 +48,7 @@ from typing import Optional
 from cupertino_processor import StreamProcessorService
 from cupertino_processor.config import ProcessorConfig
 from cupertino_control import MQTTControlPlane
-from cupertino_mqtt import DetectionPublisher, ZoneEventPublisher, create_logger
+from cupertino_mqtt import DetectionPublisher, ZoneEventPublisher, SharedConnection, create_logger
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -164,6 +164,16 @@ class ProcessorApp:
         # 4. Create publishers
         self.logger.info("📤 Creating MQTT publishers")
 
+        # Both publishers share one MQTT connection (one socket, one loop thread)
+        publisher_connection = SharedConnection(
+            broker_host=self.config.mqtt_config.broker,
+            broker_port=self.config.mqtt_config.port,
+            client_id=f"publisher_{self.config.service_id}",
+            logger=mqtt_logger,
+            username=self.config.mqtt_config.username,
+            password=self.config.mqtt_config.password,
+        )
+
         # Detection publisher
         detection_topic = self.config.mqtt_config.detection_topic.format(
             service_id=self.config.service_id
@@ -173,10 +183,8 @@ class ProcessorApp:
             broker_port=self.config.mqtt_config.port,
             topic=detection_topic,
             logger=mqtt_logger,
-            client_id=f"publisher_detections_{self.config.service_id}",
-            username=self.config.mqtt_config.username,
-            password=self.config.mqtt_config.password,
             qos=self.config.mqtt_config.qos,
+            connection=publisher_connection,
         )
 
         # Zone event publisher
@@ -188,10 +196,8 @@ class ProcessorApp:
             broker_port=self.config.mqtt_config.port,
             topic=zone_event_topic,
             logger=mqtt_logger,
-            client_id=f"publisher_zones_{self.config.service_id}",
-            username=self.config.mqtt_config.username,
-            password=self.config.mqtt_config.password,
             qos=self.config.mqtt_config.qos,
+            connection=publisher_connection,
         )
 
         self.logger.info(f"  - Detection topic: {detection_topic}")